@@ -7,9 +7,10 @@ from homeassistant.const import CONF_HOST, CONF_MAC, Platform
 from homeassistant.core import HomeAssistant
 
 from .const import _LOGGER, DOMAIN
-from .coordinator import ZidooCoordinator
+from .coordinator import ZidooCoordinator, library_state_store, media_cache_store
 from .frontend import ZidooCardRegistration
-from .zidooaio import ZidooRC
+from .library import music_library_store, video_library_store
+from .zidooaio import ZidooConnectionPool, ZidooRC
 
 PLATFORMS = [Platform.MEDIA_PLAYER, Platform.REMOTE]
 
@@ -22,7 +23,15 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     coordinator = ZidooCoordinator(hass=hass, player=client, config_entry=config_entry)
 
     config_entry.async_on_unload(config_entry.add_update_listener(update_listener))
+    # also runs when setup fails, ends the device warm up started by connect
+    config_entry.async_on_unload(client.disconnect)
+    await coordinator.async_load_media_cache()
+    await coordinator.async_load_library_state()
+    await coordinator.video_library.async_load()
+    await coordinator.music_library.async_load()
+    await coordinator.async_update_search_index()
     await coordinator.async_config_entry_first_refresh()
+    coordinator.async_start_library_sync()
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][config_entry.entry_id] = coordinator
@@ -41,7 +50,8 @@ async def async_unload_entry(hass: HomeAssistant, confid_entry: ConfigEntry) ->
         confid_entry, PLATFORMS
     )
     if unload_ok:
-        hass.data[DOMAIN].pop(confid_entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(confid_entry.entry_id)
+        await coordinator.async_shutdown()
 
     # Unload custom card resource if last instance
     other_entries = [
@@ -52,10 +62,21 @@ async def async_unload_entry(hass: HomeAssistant, confid_entry: ConfigEntry) ->
     if len(other_entries) == 0:
         cards = ZidooCardRegistration(hass, DOMAIN)
         await cards.async_unregister()
+        if unload_ok:
+            # release pooled connections shared by the players
+            await ZidooConnectionPool.get(hass.loop).close()
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Remove stored data of a config entry."""
+    await media_cache_store(hass, config_entry.entry_id).async_remove()
+    await library_state_store(hass, config_entry.entry_id).async_remove()
+    await video_library_store(hass, config_entry.entry_id).async_remove()
+    await music_library_store(hass, config_entry.entry_id).async_remove()
+
+
 async def update_listener(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
     """Handle options update."""
     await hass.config_entries.async_reload(config_entry.entry_id)
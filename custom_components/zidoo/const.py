@@ -18,6 +18,7 @@ _LOGGER = logging.getLogger(__package__)
 
 DOMAIN = "zidoo"
 DATA_ZIDOO_CONFIG = "zidoo_config"
+DATA_FLEET = "zidoo_fleet"
 VERSION = "1.1.1"
 DATA = "data"
 UPDATE_TRACK = "update_track"
@@ -40,7 +41,11 @@ BUTTON_SERVICE = "send_key"
 EVENT_TURN_ON = "zidoo.turn_on"
 EVENT_TURN_OFF = "zidoo.turn_off"
 
+# Events
+EVENT_LIBRARY_CHANGED = "zidoo.library_changed"
+
 MEDIA_TYPE_FILE = "file"
+MEDIA_TYPE_SEARCH = "search"  # unified video and music search
 
 ZSHORTCUTS = [
     {"name": "FAVORITES", "path": "favorite", "type": MediaType.VIDEO},
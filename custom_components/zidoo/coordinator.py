@@ -2,26 +2,232 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from contextlib import asynccontextmanager
+from copy import copy
+from datetime import datetime, timedelta
+from time import monotonic
 from typing import Any, Final
 
 from homeassistant.components.media_player import MediaPlayerState, MediaType
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_UNIQUE_ID
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util.dt import utcnow
 
-from .const import _LOGGER, CONF_POWERMODE, DOMAIN, EVENT_TURN_ON
+from .const import (
+    _LOGGER,
+    CONF_POWERMODE,
+    CONF_SHORTCUT,
+    DATA_FLEET,
+    DOMAIN,
+    EVENT_LIBRARY_CHANGED,
+    EVENT_TURN_ON,
+    ZDEFAULT_SHORTCUTS,
+)
+from .library import (
+    LIBRARY_CHECK_INTERVAL,
+    ZidooMusicLibrary,
+    ZidooVideoLibrary,
+)
+from .search import SEARCH_FIELDS, ZidooSearchIndex
 from .zidooaio import ZCONTENT_MUSIC, ZCONTENT_VIDEO, ZSTATE_PLAYING, ZidooRC
 
-SCAN_INTERVAL: Final = timedelta(seconds=5)
-SCAN_INTERVAL_RAPID: Final = timedelta(seconds=1)
+SCAN_INTERVAL: Final = timedelta(seconds=5)  # player off
+SCAN_INTERVAL_RAPID: Final = timedelta(seconds=1)  # after commands and near track end
+SCAN_INTERVAL_PLAYING: Final = timedelta(seconds=10)  # steady playback
+SCAN_INTERVAL_IDLE: Final = timedelta(seconds=30)  # idle or paused
+RAPID_WINDOW: Final = 10  # seconds of rapid polling after a command or state change
+RAPID_NEAR_END: Final = 15000  # ms before the end of a track polled rapidly
+POSITION_DRIFT: Final = 2000  # ms of unexpected position change shown as a seek
+COMMAND_VERIFY_DELAY: Final = 0.5  # seconds before polling the result of a command
+FLEET_LIMIT: Final = 4  # polls in flight across all players
+MUSIC_FINGERPRINTS: Final = {"music", "album", "artist", "playlist"}
+STORAGE_VERSION: Final = 1
+MEDIA_CACHE_SAVE_DELAY: Final = 60  # seconds media cache changes are batched
 
 
-class ZidooCoordinator(DataUpdateCoordinator[None]):
-    """Representation of a Zidoo Media Player Coordinator."""
+def media_cache_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the store of the media metadata cache of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.media_cache")
+
+
+def library_state_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the store of the library fingerprint and version of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.library_state")
+
+
+class PlaybackClock:
+    """Playback position model.
+
+    The position is extrapolated from the last anchor sample at the playback
+    rate, and only re-anchored on a seek (drift), play/pause or media change.
+    """
+
+    def __init__(self, drift: float = POSITION_DRIFT) -> None:
+        """Initialize the clock.
+
+        Parameters
+            drift: float
+                ms between sample and expected position treated as a seek
+        """
+        self._drift = drift
+        self._media = None
+        self._anchored = 0.0
+        self.position: float | None = None
+        self.rate = 0.0
+        self.updated_at: datetime | None = None
+
+    @property
+    def expected(self) -> float | None:
+        """Interpolated position in ms."""
+        if self.position is None:
+            return None
+        return self.position + (monotonic() - self._anchored) * 1000 * self.rate
+
+    def anchor(self, position: float | None, rate: float, media=None) -> None:
+        """Set the clock to a known position and rate."""
+        self.position = position
+        self.rate = rate
+        self._media = media
+        self._anchored = monotonic()
+        self.updated_at = None if position is None else utcnow()
+
+    def adjust(self, position: float | None = None, rate: float | None = None) -> None:
+        """Re-anchor the current media at a new position and/or rate."""
+        if position is None:
+            position = self.expected
+        self.anchor(position, self.rate if rate is None else rate, self._media)
+
+    def update(self, position: float | None, rate: float, media=None) -> bool:
+        """Add a polled sample.
+
+        Parameters
+            position: float
+                sampled position in ms
+            rate: float
+                playback rate (1 when playing, 0 when paused)
+            media:
+                current media identity
+        Returns
+            True if the clock was re-anchored
+        """
+        if (
+            rate == self.rate
+            and media == self._media
+            and (position is None) == (self.position is None)
+            and (position is None or abs(position - self.expected) <= self._drift)
+        ):
+            return False
+        self.anchor(position, rate, media)
+        return True
+
+
+class ZidooFleetScheduler:
+    """Poll scheduler shared by all players.
+
+    Spreads the poll phases of the players over their poll interval and caps
+    the polls in flight, so many players do not poll in lockstep.  Commands
+    are not queued here and still run immediately.
+    """
+
+    def __init__(self, limit: int = FLEET_LIMIT) -> None:
+        """Initialize the scheduler.
+
+        Parameters
+            limit: int
+                polls in flight across all players
+        """
+        self._semaphore = asyncio.Semaphore(limit)
+        self._members: list[str] = []
+        self._stats: dict[str, dict] = {}
+
+    @classmethod
+    def get(cls, hass: HomeAssistant) -> ZidooFleetScheduler:
+        """Return the scheduler shared by the config entries."""
+        if DATA_FLEET not in hass.data:
+            hass.data[DATA_FLEET] = cls()
+        return hass.data[DATA_FLEET]
+
+    def register(self, member: str) -> None:
+        """Add a player to the fleet."""
+        if member not in self._members:
+            self._members.append(member)
+            self._stats[member] = {
+                "polls": 0,
+                "wait_total": 0.0,
+                "wait_max": 0.0,
+                "poll_total": 0.0,
+            }
+
+    def unregister(self, member: str) -> None:
+        """Remove a player from the fleet."""
+        if member in self._members:
+            self._members.remove(member)
+            self._stats.pop(member)
+
+    def align(self, member: str, interval: timedelta) -> timedelta:
+        """Return the interval adjusted to the phase of the player.
+
+        Phases are spread evenly over the interval in registration order,
+        and the result stays within half an interval of the one requested.
+        """
+        if len(self._members) < 2 or member not in self._members:
+            return interval
+        period = interval.total_seconds()
+        phase = self._members.index(member) * period / len(self._members)
+        # refreshes are scheduled from the whole second
+        start = int(asyncio.get_running_loop().time()) + period
+        offset = (phase - start) % period
+        if offset > period / 2:
+            offset -= period
+        return timedelta(seconds=period + offset)
+
+    @asynccontextmanager
+    async def slot(self, member: str):
+        """Wait for a fleet poll slot."""
+        queued = monotonic()
+        async with self._semaphore:
+            started = monotonic()
+            try:
+                yield
+            finally:
+                stats = self._stats.get(member)
+                if stats is not None:
+                    wait = started - queued
+                    stats["polls"] += 1
+                    stats["wait_total"] += wait
+                    stats["wait_max"] = max(stats["wait_max"], wait)
+                    stats["poll_total"] += monotonic() - started
+
+    def stats(self, member: str) -> dict:
+        """Return fairness counters of a player."""
+        stats = self._stats.get(member)
+        if not stats:
+            return {}
+        polls = stats["polls"]
+        fleet_polls = sum(item["polls"] for item in self._stats.values())
+        return {
+            "players": len(self._members),
+            "phase": self._members.index(member),
+            "polls": polls,
+            "poll_share": round(polls / fleet_polls, 3) if fleet_polls else 0,
+            "wait_avg": round(stats["wait_total"] / polls, 3) if polls else 0,
+            "wait_max": round(stats["wait_max"], 3),
+            "poll_avg": round(stats["poll_total"] / polls, 3) if polls else 0,
+        }
+
+
+class ZidooCoordinator(DataUpdateCoordinator[int]):
+    """Representation of a Zidoo Media Player Coordinator.
+
+    The coordinator data is a publish counter that only changes when a user
+    visible value changes, so listeners are not written on every poll.
+    """
 
     def __init__(
         self,
@@ -40,10 +246,32 @@ class ZidooCoordinator(DataUpdateCoordinator[None]):
         self._source_list = []
         self._media_type = None
         self._media_info = {}
-        self._last_update = None
+        self._clock = PlaybackClock()
         self._last_state = MediaPlayerState.OFF
         self._audio_output_list = []
         self._last_audio_output = None
+        self._published = None
+        self._publish_count = 0
+        self._rapid_until = 0.0
+        self._optimistic: dict | None = None
+        self._rollback: tuple[MediaPlayerState | None, PlaybackClock] | None = None
+        self._optimistic_at = 0.0
+        self._verify_unsub: CALLBACK_TYPE | None = None
+        self._media_store = media_cache_store(hass, config_entry.entry_id)
+        self._media_cache_revision = 0
+        shortcuts = config_entry.options.get(CONF_SHORTCUT, ZDEFAULT_SHORTCUTS)
+        self.video_library = ZidooVideoLibrary(
+            hass, player, config_entry.entry_id, views=shortcuts
+        )
+        self.music_library = ZidooMusicLibrary(
+            hass, player, config_entry.entry_id, types=shortcuts
+        )
+        self.search_index = ZidooSearchIndex()
+        self.library_version = 0
+        self._library_fingerprint: dict = {}
+        self._library_store = library_state_store(hass, config_entry.entry_id)
+        self._fleet = ZidooFleetScheduler.get(hass)
+        self._fleet.register(self._unique_id)
 
         super().__init__(
             hass,
@@ -53,8 +281,103 @@ class ZidooCoordinator(DataUpdateCoordinator[None]):
             request_refresh_debouncer=Debouncer(
                 hass, _LOGGER, cooldown=1.0, immediate=False
             ),
+            always_update=False,
+        )
+
+    async def async_load_media_cache(self) -> None:
+        """Restore the media metadata cache saved by a previous run."""
+        self.player.media_cache.restore(await self._media_store.async_load())
+
+    async def async_load_library_state(self) -> None:
+        """Restore the library fingerprint and version saved by a previous run."""
+        data = await self._library_store.async_load()
+        if data:
+            self.library_version = data["version"]
+            self._library_fingerprint = data["fingerprint"]
+
+    @callback
+    def async_start_library_sync(self) -> None:
+        """Mirror the libraries now, then check them every LIBRARY_CHECK_INTERVAL."""
+        self._config_entry.async_create_background_task(
+            self.hass, self._async_check_library(None), "zidoo library sync"
+        )
+        self._config_entry.async_on_unload(
+            async_track_time_interval(
+                self.hass, self._async_check_library, LIBRARY_CHECK_INTERVAL
+            )
         )
 
+    async def _async_check_library(self, _now) -> None:
+        """Compare the library fingerprint and sync the mirrors that need it."""
+        if not self.player.is_connected():
+            return
+        fingerprint = await self.player.get_library_fingerprint(
+            ["video", *self.music_library.fingerprint_parts]
+        )
+        if fingerprint is None:
+            return
+        changed = {
+            part
+            for part, value in fingerprint.items()
+            if part in self._library_fingerprint
+            and value != self._library_fingerprint[part]
+        }
+        fingerprint = {**self._library_fingerprint, **fingerprint}
+        if changed:
+            self.library_version += 1
+            _LOGGER.debug(
+                "%s library changed (%s), version %d",
+                self._name,
+                ", ".join(sorted(changed)),
+                self.library_version,
+            )
+            if "video" in changed:
+                self.player.media_cache.validate(fingerprint["video"])
+            self.hass.bus.async_fire(
+                EVENT_LIBRARY_CHANGED,
+                {
+                    CONF_UNIQUE_ID: self._unique_id,
+                    "version": self.library_version,
+                    "changed": sorted(changed),
+                },
+            )
+        if fingerprint != self._library_fingerprint:
+            self._library_fingerprint = fingerprint
+            await self._library_store.async_save(
+                {"version": self.library_version, "fingerprint": fingerprint}
+            )
+        await self._async_sync_library(fingerprint)
+
+    async def _async_sync_library(self, fingerprint: dict) -> None:
+        """Sync the library mirrors, which skip the parts they have synced."""
+        changed = await self.video_library.async_sync(fingerprint.get("video"))
+        music = {
+            part: value
+            for part, value in fingerprint.items()
+            if part in MUSIC_FINGERPRINTS
+        }
+        changed = await self.music_library.async_sync(music) or changed
+        if changed:
+            await self.async_update_search_index()
+
+    async def async_update_search_index(self) -> None:
+        """Rebuild the search index from the library mirrors."""
+        catalogs = {}
+        if self.video_library.synced:
+            catalogs["video"] = list(self.video_library.items.values())
+        for catalog in SEARCH_FIELDS:
+            if catalog in self.music_library.lists:
+                catalogs[catalog] = self.music_library.items(catalog)
+        await self.hass.async_add_executor_job(self.search_index.update, catalogs)
+
+    @callback
+    def _async_save_media_cache(self) -> None:
+        """Schedule a save of the media metadata cache when it has changed."""
+        cache = self.player.media_cache
+        if cache.revision != self._media_cache_revision:
+            self._media_cache_revision = cache.revision
+            self._media_store.async_delay_save(cache.export, MEDIA_CACHE_SAVE_DELAY)
+
     async def async_refresh_audio_outputs(self, force=True):
         """Update audio output list."""
         if not force and not self._audio_output_list:
@@ -71,13 +394,24 @@ class ZidooCoordinator(DataUpdateCoordinator[None]):
             for key in sources:
                 self._source_list.append(key)
 
-    async def _async_update_data(self) -> None:
+    async def _async_update_data(self) -> int:
         """Update data callback."""
+        async with self._fleet.slot(self._unique_id):
+            return await self._async_poll()
+
+    async def _async_poll(self) -> int:
+        """Poll the player and publish changes."""
+        started = monotonic()
         if not self.player.is_connected():
             await self.player.connect()
+            # outputs are reloaded with the device on reconnect
+            self._audio_output_list = []
 
         # Retrieve the latest data.
         state = MediaPlayerState.OFF
+        source = self._source
+        media_info = self._media_info
+        media_type = self._media_type
         try:
             if self.player.is_connected():
                 state = MediaPlayerState.PAUSED
@@ -87,14 +421,14 @@ class ZidooCoordinator(DataUpdateCoordinator[None]):
                     self._last_audio_output = await self.player.get_audio_output()
 
                 await self.async_refresh_channels(force=False)
-                self._source = await self.player.get_source()
+                source = await self.player.get_source()
                 playing_info = await self.player.get_playing_info()
-                self._media_info = {}
+                media_info = {}
                 if playing_info is None or not playing_info:
-                    self._media_type = MediaType.APP
+                    media_type = MediaType.APP
                     state = MediaPlayerState.IDLE
                 else:
-                    self._media_info = playing_info
+                    media_info = playing_info
                     status = playing_info.get("status")
                     if status and status is not None:
                         if status == ZSTATE_PLAYING or status is True:
@@ -102,50 +436,182 @@ class ZidooCoordinator(DataUpdateCoordinator[None]):
                     mediatype = playing_info.get("source")
                     if mediatype and mediatype is not None:
                         if mediatype == "video":
-                            item_type = self._media_info.get("type")
+                            item_type = media_info.get("type")
                             if item_type is not None and item_type == "tv":
-                                self._media_type = MediaType.TVSHOW
+                                media_type = MediaType.TVSHOW
                             else:
-                                self._media_type = MediaType.MOVIE
-                            self._source = ZCONTENT_VIDEO
+                                media_type = MediaType.MOVIE
+                            source = ZCONTENT_VIDEO
                         else:
-                            self._media_type = MediaType.MUSIC
-                            self._source = ZCONTENT_MUSIC
+                            media_type = MediaType.MUSIC
+                            source = ZCONTENT_MUSIC
                     else:
-                        self._media_type = MediaType.APP
-                    self._last_update = utcnow()
+                        media_type = MediaType.APP
 
         except Exception as ex:  # noqa: BLE001
             _LOGGER.debug("update error: {%s}", str(ex))
-            return
+            return self._publish_count
+
+        self._async_save_media_cache()
+        if started < self._optimistic_at:
+            # poll started before the last command, wait for verification
+            return self._publish_count
 
         if state != self._last_state:
             _LOGGER.debug("%s New state (%s)", self._name, state)
             self._last_state = state
-            self.update_interval = (
-                SCAN_INTERVAL if state == MediaPlayerState.OFF else SCAN_INTERVAL_RAPID
-            )
+            self._rapid_until = monotonic() + RAPID_WINDOW
         self._state = state
+        self._source = source
+        self._media_info = media_info
+        self._media_type = media_type
+        self.update_interval = self._fleet.align(self._unique_id, self._next_interval())
+        return self._async_publish()
+
+    def _next_interval(self) -> timedelta:
+        """Poll interval for the current playback context."""
+        if self._state == MediaPlayerState.OFF:
+            return SCAN_INTERVAL
+        if monotonic() < self._rapid_until:
+            return SCAN_INTERVAL_RAPID
+        if self._state == MediaPlayerState.PLAYING:
+            duration = self._media_info.get("duration")
+            position = self._media_info.get("position")
+            if (
+                duration
+                and position is not None
+                and duration - position < RAPID_NEAR_END
+            ):
+                return SCAN_INTERVAL_RAPID
+            return SCAN_INTERVAL_PLAYING
+        return SCAN_INTERVAL_IDLE
+
+    async def async_command_sent(self) -> None:
+        """Poll rapidly, starting with a quick poll to verify a user command."""
+        self._rapid_until = monotonic() + RAPID_WINDOW
+        self.update_interval = SCAN_INTERVAL_RAPID
+        if self._verify_unsub:
+            self._verify_unsub()
+        self._verify_unsub = async_call_later(
+            self.hass, COMMAND_VERIFY_DELAY, self._async_verify_command
+        )
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending refreshes and save the media caches."""
+        if self._verify_unsub:
+            self._verify_unsub()
+            self._verify_unsub = None
+        self._fleet.unregister(self._unique_id)
+        if self.player.media_cache.revision:
+            await self._media_store.async_save(self.player.media_cache.export())
+        await self.video_library.async_save()
+        await self.music_library.async_save()
+        await super().async_shutdown()
+
+    async def _async_verify_command(self, _now) -> None:
+        """Poll the result of a user command."""
+        self._verify_unsub = None
+        await self.async_refresh()
+
+    @callback
+    def async_set_optimistic(
+        self,
+        state: MediaPlayerState | None = None,
+        position: float | None = None,
+    ) -> None:
+        """Show the expected result of a command until verified.
 
-    async def async_set_audio_output(self, audio_output: str) -> None:
+        Parameters
+            state: MediaPlayerState
+                expected player state
+            position: float
+                expected playback position in ms
+        """
+        if self._optimistic is None:
+            self._rollback = (self._state, copy(self._clock))
+        self._optimistic = {}
+        if state is not None:
+            self._state = self._optimistic["state"] = state
+        if position is not None or self._clock.position is not None:
+            self._clock.adjust(
+                position, 1.0 if self._state == MediaPlayerState.PLAYING else 0.0
+            )
+        self._optimistic_at = monotonic()
+        self._async_publish_now()
+
+    @callback
+    def async_cancel_optimistic(self) -> None:
+        """Roll back the optimistic state of a failed command."""
+        if self._optimistic is None:
+            return
+        _LOGGER.debug("%s command failed, rolling back", self._name)
+        self._state, self._clock = self._rollback
+        self._optimistic = self._rollback = None
+        self._async_publish_now()
+
+    def _async_publish_now(self) -> None:
+        """Publish the local state to the listeners."""
+        self._published = self._snapshot()
+        self._publish_count += 1
+        self.data = self._publish_count
+        self.async_update_listeners()
+
+    def _snapshot(self) -> dict:
+        """User visible state, except the playback position."""
+        return {
+            "state": self._state,
+            "source": self._source,
+            "source_list": list(self._source_list),
+            "media_type": self._media_type,
+            "audio_output": self._last_audio_output,
+            "audio_output_list": list(self._audio_output_list),
+            "media_info": {
+                key: value
+                for key, value in self._media_info.items()
+                if key != "position"
+            },
+        }
+
+    def _async_publish(self) -> int:
+        """Return the publish counter, advanced when listeners need an update."""
+        snapshot = self._snapshot()
+        reanchored = self._clock.update(
+            self._media_info.get("position"),
+            1.0 if self._state == MediaPlayerState.PLAYING else 0.0,
+            (self._source, self._media_info.get("uri"), self._media_info.get("id")),
+        )
+        if self._optimistic is not None:
+            # only the fields the command changed are verified
+            if any(snapshot[key] != value for key, value in self._optimistic.items()):
+                _LOGGER.debug("%s command not confirmed, rolling back", self._name)
+            self._optimistic = self._rollback = None
+        if snapshot != self._published or reanchored:
+            self._published = snapshot
+            self._publish_count += 1
+        return self._publish_count
+
+    async def async_set_audio_output(self, audio_output: str) -> bool:
         """Set audio output."""
-        await self._player.set_audio_output(audio_output)
+        return await self._player.set_audio_output(audio_output)
 
-    async def async_turn_on(self, **kwargs: Any) -> None:
+    async def async_turn_on(self, **kwargs: Any) -> bool:
         """Turn the media player on."""
-        if self._state == MediaPlayerState.OFF:
-            # Try 'zidoo.turn_on' event for automaton control
-            data = kwargs.get("event_data", {CONF_UNIQUE_ID: self._unique_id})
-            self.hass.bus.async_fire(EVENT_TURN_ON, data)
-            # Try API and WOL
-            await self._player.turn_on()
+        if self._state != MediaPlayerState.OFF:
+            return False
+        # Try 'zidoo.turn_on' event for automaton control
+        data = kwargs.get("event_data", {CONF_UNIQUE_ID: self._unique_id})
+        self.hass.bus.async_fire(EVENT_TURN_ON, data)
+        # Try API and WOL, the event and WOL cannot fail so always poll
+        await self._player.turn_on()
+        return True
 
-    async def async_turn_off(self, **kwargs: Any) -> None:
+    async def async_turn_off(self, **kwargs: Any) -> bool:
         """Turn off media player."""
-        if self._state != MediaPlayerState.OFF:
-            await self._player.turn_off(
-                self._config_entry.options.get(CONF_POWERMODE, False)
-            )
+        if self._state == MediaPlayerState.OFF:
+            return False
+        return await self._player.turn_off(
+            self._config_entry.options.get(CONF_POWERMODE, False)
+        )
 
     @property
     def player(self):
@@ -188,7 +654,22 @@ class ZidooCoordinator(DataUpdateCoordinator[None]):
         """Source List."""
         return self._source_list
 
+    @property
+    def library_fingerprint(self) -> dict:
+        """Last library fingerprint of the player."""
+        return dict(self._library_fingerprint)
+
+    @property
+    def fleet_stats(self) -> dict:
+        """Fleet poll scheduling counters of the player."""
+        return self._fleet.stats(self._unique_id)
+
+    @property
+    def media_position(self):
+        """Playback position (ms) at last_updated."""
+        return self._clock.position
+
     @property
     def last_updated(self):
-        """Last state update."""
-        return self._last_update
+        """Last playback position update."""
+        return self._clock.updated_at
@@ -19,9 +19,25 @@ async def async_get_config_entry_diagnostics(
     """Return diagnostics for a config entry."""
     coordinator: ZidooCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    device_info = await coordinator.player.get_system_info()
+    player = coordinator.player
+    device_info = await player.get_system_info()
 
     return {
         "config_entry": async_redact_data(config_entry.as_dict(), TO_REDACT),
         "device_info": async_redact_data(device_info, TO_REDACT),
+        "connection": {
+            **player.connection_stats,
+            "circuit_breaker": player.breaker_state,
+            "warm_up": player.init_progress,
+        },
+        "endpoint_latency": player.retry_policy.stats(),
+        "endpoint_stats": player.endpoint_stats,
+        "fleet": coordinator.fleet_stats,
+        "library": {
+            "version": coordinator.library_version,
+            "fingerprint": coordinator.library_fingerprint,
+        },
+        "video_library": coordinator.video_library.stats(),
+        "music_library": coordinator.music_library.stats(),
+        "search_index": coordinator.search_index.stats(),
     }
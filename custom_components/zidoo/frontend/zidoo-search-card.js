@@ -16,7 +16,7 @@ customElements.whenDefined('card-tools').then(() => {
       if (!this.entity_id)
         throw new Error("Add a valid media player 'entity' in the Card Configuration!");
 
-      this.buttons = this.config.buttons || ["video","movie","tvshow","music","album","artist"]
+      this.buttons = this.config.buttons || ["search","video","movie","tvshow","music","album","artist"]
 
       this.search_text = this.config.search_text || "Media search...";
     }
@@ -64,6 +64,11 @@ customElements.whenDefined('card-tools').then(() => {
             </div>
             <div id="searchButtons" class="sub-section">
               <div class="sub-heading">Search Media</div>
+              ${(this.buttons.includes("search")) ? ct.LitHtml `
+              <ha-progress-button id=${"search"} @click=${this._searchMedia}>
+                <ha-icon id=${"search"} icon="hass:magnify" class="padded-right"></ha-icon>
+                All
+              </ha-progress-button>` : ''}
               ${(this.buttons.includes("video")) ? ct.LitHtml `
               <ha-progress-button id=${"video"} @click=${this._searchMedia}>
                 <ha-icon id=${"video"} icon="hass:video" class="padded-right"></ha-icon>
@@ -0,0 +1,528 @@
+"""Local mirror of the Zidoo media library."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from datetime import timedelta
+from time import time
+from typing import Final
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import _LOGGER, DOMAIN
+from .zidooaio import (
+    ZMEDIA_TYPE_ALBUM,
+    ZMEDIA_TYPE_ARTIST,
+    ZMEDIA_TYPE_PLAYLIST,
+    ZMUSIC_SEARCH_TYPES,
+    ZVIDEO_FILTER_TYPES,
+    ZidooListError,
+    ZidooRC,
+)
+
+STORAGE_VERSION: Final = 1
+LIBRARY_KNOWN_RUN: Final = 200  # known ids in a row ending an incremental sync
+LIBRARY_CHECK_INTERVAL: Final = timedelta(minutes=5)  # library fingerprint checks
+LIBRARY_SYNC_INTERVAL: Final = timedelta(minutes=15)  # video state view refreshes
+LIBRARY_FULL_SYNC: Final = 6 * 3600  # seconds between syncs detecting removed ids
+LIBRARY_SAVE_DELAY: Final = 30  # seconds library changes are batched
+LIBRARY_VIEWS: Final = ["all", "recent"]  # views always mirrored
+LIBRARY_STATE_VIEWS: Final = ["favorite", "watching", "unwatched"]  # paged each sync
+LIBRARY_FETCH_LIMIT: Final = 2  # concurrent music content fetches
+MUSIC_CONTENT_TYPES: Final = ["album", "artist", "playlist"]  # types with music lists
+MUSIC_SONG_TYPE: Final = "music"  # type of the song list
+
+
+def video_library_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the store of the video library mirror of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.video_library")
+
+
+def music_library_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the store of the music library mirror of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.music_library")
+
+
+class ZidooVideoLibrary:
+    """Local mirror of the video library (getAggregations).
+
+    Items are kept by id, with the ordered ids of each mirrored filter view.
+    An incremental sync streams the recent view until it finds no new ids, and
+    only pages the other views, as filtered by the player, when ids were
+    added.  Views of playback state (LIBRARY_STATE_VIEWS) are paged each sync.
+    Full syncs, that also detect removed ids, run when the library fingerprint
+    changes and every LIBRARY_FULL_SYNC seconds.  Sync times and the synced
+    fingerprint are saved with the mirror, so a restart does not page the
+    library again.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        player: ZidooRC,
+        entry_id: str,
+        views: list[str] | None = None,
+    ) -> None:
+        """Initialize the mirror.
+
+        Parameters
+            player: ZidooRC
+                player api
+            entry_id: str
+                config entry used for the store
+            views: list
+                filter views mirrored in addition to LIBRARY_VIEWS
+        """
+        self._hass = hass
+        self._player = player
+        self._store = video_library_store(hass, entry_id)
+        self._views = list(LIBRARY_VIEWS)
+        for view in views or []:
+            if view in ZVIDEO_FILTER_TYPES and view not in self._views:
+                self._views.append(view)
+        self._lock = asyncio.Lock()
+        self._fingerprint = None
+        self._synced_at = 0.0
+        self._full_synced = 0.0
+        self._unsaved = False
+        self.items: dict[int, dict] = {}
+        self.views: dict[str, list[int]] = {}
+
+    @property
+    def full_sync_due(self) -> bool:
+        """Return True when the next sync should detect removed ids.
+
+        Removals are only detected by a full sync, so one runs first.
+        """
+        return time() - self._full_synced > LIBRARY_FULL_SYNC
+
+    @property
+    def sync_due(self) -> bool:
+        """Return True when the state views should be paged again."""
+        return time() - self._synced_at > LIBRARY_SYNC_INTERVAL.total_seconds()
+
+    @property
+    def synced(self) -> bool:
+        """Return True once the library has been mirrored."""
+        return "all" in self.views
+
+    def view(self, filter_type: str) -> dict | None:
+        """Return a mirrored filter view as a getAggregations response.
+
+        Returns
+            None if the view is not mirrored
+        """
+        ids = self.views.get(filter_type)
+        if ids is None:
+            return None
+        return {"array": [self.items[item_id] for item_id in ids]}
+
+    def stats(self) -> dict:
+        """Return mirror counters."""
+        return {
+            "items": len(self.items),
+            "views": {view: len(ids) for view, ids in self.views.items()},
+        }
+
+    async def async_load(self) -> None:
+        """Restore the mirror saved by a previous run."""
+        data = await self._store.async_load()
+        if not data:
+            return
+        self.items = {item["id"]: item for item in data.get("items", [])}
+        self.views = {
+            view: [item_id for item_id in ids if item_id in self.items]
+            for view, ids in data.get("views", {}).items()
+            if view in self._views
+        }
+        if all(view in self.views for view in self._views):
+            self._fingerprint = data.get("fingerprint")
+            self._synced_at = data.get("synced_at", 0.0)
+            self._full_synced = data.get("full_synced", 0.0)
+
+    def _export(self) -> dict:
+        """Return the mirror as json serializable data."""
+        self._unsaved = False
+        return {
+            "items": list(self.items.values()),
+            "views": self.views,
+            "fingerprint": self._fingerprint,
+            "synced_at": self._synced_at,
+            "full_synced": self._full_synced,
+        }
+
+    async def async_save(self) -> None:
+        """Save unsaved changes of the mirror now."""
+        if self._unsaved:
+            await self._store.async_save(self._export())
+
+    async def _async_fetch_view(
+        self, filter_type: str, known: dict | None = None
+    ) -> list | None:
+        """Async Stream a filter view.
+
+        Parameters
+            filter_type: str
+                see ZVIDEO_FILTER_TYPES
+            known: dict
+                stop after LIBRARY_KNOWN_RUN consecutive ids found in known
+        Returns
+            list
+                view items, None if a page failed
+        """
+        items = []
+        run = 0
+        try:
+            async with contextlib.aclosing(
+                self._player.iter_movies(filter_type)
+            ) as stream:
+                async for item in stream:
+                    items.append(item)
+                    run = run + 1 if known is not None and item["id"] in known else 0
+                    if run >= LIBRARY_KNOWN_RUN:
+                        break
+        except ZidooListError:
+            return None
+        return items
+
+    async def async_sync(self, fingerprint=None, full: bool = False) -> bool:
+        """Async Sync the mirror with the player.
+
+        Parameters
+            fingerprint: list
+                video part of the library fingerprint, the sync is skipped
+                while it is unchanged and no view refresh is due, and a
+                changed fingerprint runs a full sync
+            full: bool
+                page all views to also detect removed ids
+        Returns
+            True if the mirror has changed
+        """
+        if not self._player.is_connected():
+            return False
+        async with self._lock:
+            if fingerprint is not None and fingerprint != self._fingerprint:
+                full = True
+            full = full or self.full_sync_due
+            if fingerprint is not None and not full and not self.sync_due:
+                return False
+            recent = await self._async_fetch_view(
+                "recent", None if full else self.items
+            )
+            if recent is None:
+                return False
+            fetched = {item["id"] for item in recent}
+            added = fetched - self.items.keys()
+            views = {}
+            for view in self._views:
+                if view == "recent":
+                    continue
+                if full or added or view in LIBRARY_STATE_VIEWS:
+                    views[view] = await self._async_fetch_view(view)
+            if any(items is None for items in views.values()):
+                return False
+            if not full:
+                # only the first pages of recent can change, keep the mirrored
+                # tail without the ids a paged full library no longer lists
+                listed = (
+                    {item["id"] for item in views["all"]} if "all" in views else None
+                )
+                recent = recent + [
+                    self.items[item_id]
+                    for item_id in self.views.get("recent", [])
+                    if item_id not in fetched and (listed is None or item_id in listed)
+                ]
+            views["recent"] = recent
+            self._synced_at = time()
+            if fingerprint is not None and fingerprint != self._fingerprint:
+                self._fingerprint = fingerprint
+                self._unsaved = True
+            return self._update(views, full or bool(added))
+
+    def _update(self, views: dict[str, list], rebuild: bool) -> bool:
+        """Merge fetched views, dropping ids no view contains when rebuilding."""
+        items = dict(self.items)
+        for view_items in views.values():
+            for item in view_items:
+                items[item["id"]] = item
+        view_ids = {
+            **self.views,
+            **{
+                view: [item["id"] for item in view_items]
+                for view, view_items in views.items()
+            },
+        }
+        if rebuild:
+            self._full_synced = time()
+            self._unsaved = True
+            referenced = {item_id for ids in view_ids.values() for item_id in ids}
+            items = {
+                item_id: item
+                for item_id, item in items.items()
+                if item_id in referenced
+            }
+        added = items.keys() - self.items.keys()
+        removed = self.items.keys() - items.keys()
+        changed = items != self.items or view_ids != self.views
+        self.items = items
+        self.views = view_ids
+        if changed:
+            _LOGGER.debug(
+                "Video library synced: %d items (+%d -%d)",
+                len(items),
+                len(added),
+                len(removed),
+            )
+            self._unsaved = True
+        if self._unsaved:
+            self._store.async_delay_save(self._export, LIBRARY_SAVE_DELAY)
+        return changed
+
+
+class ZidooMusicLibrary:
+    """Local mirror of the music library (MusicControl/v2).
+
+    Holds the full song, album, artist and playlist lists of the mirrored
+    types, and the music of each album, artist and playlist.  Songs are kept
+    once by id, song lists only hold their ids.  Syncs are driven
+    by the library fingerprint saved with the mirror: only the lists whose
+    part changed are paged again, with the music of new albums and artists,
+    of every album and artist when the song count changed, and of the
+    playlists whose own marker changed.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        player: ZidooRC,
+        entry_id: str,
+        types: list[str] | None = None,
+    ) -> None:
+        """Initialize the mirror.
+
+        Parameters
+            player: ZidooRC
+                player api
+            entry_id: str
+                config entry used for the store
+            types: list
+                music types mirrored (see ZMUSIC_SEARCH_TYPES)
+        """
+        self._hass = hass
+        self._player = player
+        self._store = music_library_store(hass, entry_id)
+        self._types = [item for item in types or [] if item in ZMUSIC_SEARCH_TYPES]
+        self._lock = asyncio.Lock()
+        self._fingerprint: dict = {}
+        self._unsaved = False
+        self.songs: dict[int, dict] = {}
+        self.lists: dict[str, list] = {}  # song ids for the song list
+        self.music: dict[str, list[int]] = {}
+
+    @property
+    def fingerprint_parts(self) -> list[str]:
+        """Return the library fingerprint parts the mirror is synced with."""
+        parts = list(self._types)
+        if MUSIC_SONG_TYPE not in parts and (
+            ZMEDIA_TYPE_ALBUM in parts or ZMEDIA_TYPE_ARTIST in parts
+        ):
+            parts.append(MUSIC_SONG_TYPE)  # song count, for album and artist music
+        return parts
+
+    def items(self, music_type: str) -> list[dict] | None:
+        """Return the items of a mirrored list, None if not mirrored."""
+        items = self.lists.get(music_type)
+        if items is not None and music_type == MUSIC_SONG_TYPE:
+            return [self.songs[song_id] for song_id in items]
+        return items
+
+    def view(self, music_type: str, music_id: int | str | None = None) -> dict | None:
+        """Return a mirrored list as a MusicControl response.
+
+        Parameters
+            music_type: str
+                see ZMUSIC_SEARCH_TYPES
+            music_id: int or str
+                album, artist or playlist id for its music
+        Returns
+            None if the list is not mirrored
+        """
+        if music_id is None:
+            items = self.items(music_type)
+            if items is not None and music_type == ZMEDIA_TYPE_PLAYLIST:
+                return list(items)  # the playlist list is not wrapped
+        else:
+            items = self._songs(self.music.get(f"{music_type}/{music_id}"))
+        if items is None:
+            return None
+        return {"array": items}
+
+    def _songs(self, song_ids: list | None) -> list[dict] | None:
+        """Return the songs of a list of song ids."""
+        if song_ids is None:
+            return None
+        return [self.songs[song_id] for song_id in song_ids]
+
+    def stats(self) -> dict:
+        """Return mirror counters."""
+        return {
+            "lists": {
+                music_type: len(items) for music_type, items in self.lists.items()
+            },
+            "music_lists": len(self.music),
+            "songs": len(self.songs),
+        }
+
+    async def async_load(self) -> None:
+        """Restore the mirror saved by a previous run."""
+        data = await self._store.async_load()
+        if not data or "songs" not in data:
+            return
+        self.songs = {song["id"]: song for song in data["songs"]}
+        self.lists = {
+            music_type: items
+            for music_type, items in data.get("lists", {}).items()
+            if music_type in self._types
+        }
+        self.music = {
+            key: items
+            for key, items in data.get("music", {}).items()
+            if key.split("/")[0] in self.lists
+        }
+        self._fingerprint = data.get("fingerprint", {})
+
+    def _export(self) -> dict:
+        """Return the mirror as json serializable data."""
+        self._unsaved = False
+        return {
+            "songs": list(self.songs.values()),
+            "lists": self.lists,
+            "music": self.music,
+            "fingerprint": self._fingerprint,
+        }
+
+    async def async_save(self) -> None:
+        """Save unsaved changes of the mirror now."""
+        if self._unsaved:
+            await self._store.async_save(self._export())
+
+    async def _async_fetch(
+        self, music_type: str, music_id: int | str | None = None
+    ) -> list | None:
+        """Async Stream a music list.
+
+        Returns
+            list
+                list items, None if a page failed
+        """
+        try:
+            return [
+                item async for item in self._player.iter_music(music_type, music_id)
+            ]
+        except ZidooListError:
+            return None
+
+    def _changed(self, fingerprint: dict | None, part: str, key=None) -> bool:
+        """Return True when a fingerprint part (or playlist marker) changed."""
+        if fingerprint is None:
+            return True
+        if part not in fingerprint:
+            return False  # not answered, kept as synced
+        if key is None:
+            return fingerprint[part] != self._fingerprint.get(part)
+        return fingerprint[part].get(key) != self._fingerprint.get(part, {}).get(key)
+
+    async def async_sync(self, fingerprint: dict | None = None) -> bool:
+        """Async Sync the mirror with the player.
+
+        Parameters
+            fingerprint: dict
+                music parts of the library fingerprint (see
+                ZidooRC.get_library_fingerprint), None to reload everything
+        Returns
+            True if the mirror has changed
+        """
+        if not self._types or not self._player.is_connected():
+            return False
+        async with self._lock:
+            lists = {
+                music_type: self.items(music_type)
+                for music_type in self._types
+                if music_type in self.lists
+            }
+            for music_type in self._types:
+                if music_type in lists and not self._changed(fingerprint, music_type):
+                    continue
+                lists[music_type] = await self._async_fetch(music_type)
+                if lists[music_type] is None:
+                    return False
+
+            # a changed song count can change the music of any album or artist
+            songs_changed = self._changed(fingerprint, "music")
+            keys = [
+                f"{music_type}/{item['id']}"
+                for music_type in MUSIC_CONTENT_TYPES
+                for item in lists.get(music_type, [])
+            ]
+            fetch = []
+            for key in keys:
+                music_type, music_id = key.split("/", 1)
+                if key not in self.music:
+                    fetch.append(key)
+                elif music_type == ZMEDIA_TYPE_PLAYLIST:
+                    if self._changed(fingerprint, music_type, music_id):
+                        fetch.append(key)
+                elif songs_changed:
+                    fetch.append(key)
+            semaphore = asyncio.Semaphore(LIBRARY_FETCH_LIMIT)
+
+            async def fetch_music(key: str) -> list | None:
+                async with semaphore:
+                    return await self._async_fetch(*key.split("/", 1))
+
+            results = await asyncio.gather(*(fetch_music(key) for key in fetch))
+            music = {
+                key: self._songs(self.music[key]) for key in keys if key in self.music
+            }
+            for key, items in zip(fetch, results, strict=True):
+                if items is not None:
+                    music[key] = items
+            if fingerprint and all(items is not None for items in results):
+                # failed fetches keep the old parts, so the next check retries
+                fingerprint = {**self._fingerprint, **fingerprint}
+                if fingerprint != self._fingerprint:
+                    self._fingerprint = fingerprint
+                    self._unsaved = True
+            return self._update(lists, music)
+
+    def _update(self, lists: dict[str, list], music: dict[str, list]) -> bool:
+        """Replace the mirrored lists and music, keeping each song once."""
+        songs = {}
+
+        def song_ids(items: list[dict]) -> list:
+            for item in items:
+                songs[item["id"]] = item
+            return [item["id"] for item in items]
+
+        lists = {
+            music_type: song_ids(items) if music_type == MUSIC_SONG_TYPE else items
+            for music_type, items in lists.items()
+        }
+        music = {key: song_ids(items) for key, items in music.items()}
+        changed = lists != self.lists or music != self.music or songs != self.songs
+        if changed:
+            _LOGGER.debug(
+                "Music library synced: %s, %d music lists, %d songs",
+                {music_type: len(items) for music_type, items in lists.items()},
+                len(music),
+                len(songs),
+            )
+            self.songs = songs
+            self.lists = lists
+            self.music = music
+            self._unsaved = True
+        if self._unsaved:
+            self._store.async_delay_save(self._export, LIBRARY_SAVE_DELAY)
+        return changed
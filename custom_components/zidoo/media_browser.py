@@ -15,11 +15,19 @@ from .const import (
     CONF_SHORTCUT,
     ITEM_TYPE_MEDIA_CLASS,
     MEDIA_TYPE_FILE,
+    MEDIA_TYPE_SEARCH,
     ZCONTENT_ITEM_TYPE,
     ZDEFAULT_SHORTCUTS,
     ZSHORTCUTS,
+    ZTYPE_MEDIA_CLASS,
+    ZTYPE_MEDIA_TYPE,
+)
+from .zidooaio import (
+    ZMUSIC_SEARCH_TYPES,
+    ZSEARCH_SOURCES,
+    ZVIDEO_FILTER_TYPES,
+    rank_search_results,
 )
-from .zidooaio import ZMUSIC_SEARCH_TYPES, ZVIDEO_FILTER_TYPES
 
 BROWSE_LIMIT = 1000
 ZTITLE = "Zidoo Media"
@@ -29,7 +37,11 @@ async def build_item_response(entity, payload):
     """Create response payload for search described by payload."""
     search_id = payload["search_id"]
     search_type = payload["search_type"]
+    if search_type == MEDIA_TYPE_SEARCH:
+        return await build_search_response(entity, search_id)
     player = entity.coordinator.player
+    music_library = entity.coordinator.music_library
+    search_index = entity.coordinator.search_index
     is_internal = is_internal_request(entity.hass)
 
     media_class = ITEM_TYPE_MEDIA_CLASS[search_type]
@@ -74,12 +86,21 @@ async def build_item_response(entity, payload):
     elif search_type in ZMUSIC_SEARCH_TYPES:
         child_media_class = search_type  # should be class
         if "*" in search_id:
-            result = await player.search_music(search_id.replace("*", ""), search_type)
+            query = search_id.replace("*", "")
+            result = search_index.search_music(query, search_type)
+            if result is None:
+                result = await player.search_music(query, search_type)
+            elif search_type == MediaType.MUSIC:
+                player.set_song_list(result["array"])
             title = search_id
             # search_id = None
         else:
             if search_id in ZMUSIC_SEARCH_TYPES:
-                result = await player.get_music_list(search_type)
+                result = music_library.view(search_type)
+                if result is None:
+                    result = await player.get_music_list(search_type)
+                elif search_type == MediaType.MUSIC:
+                    player.set_song_list(result["array"])
                 if search_type == MediaType.PLAYLIST:  # convert playlist list
                     result.insert(0, {"name": "FAVORITES", "id": "favorites"})
                     result.insert(0, {"name": "PLAYING", "id": "playing"})
@@ -92,7 +113,9 @@ async def build_item_response(entity, payload):
                 thumbnail = get_thumbnail_url(
                     search_type, search_id, entity, is_internal
                 )
-                result = await player.get_music_list(search_type, search_id)
+                result = music_library.view(search_type, search_id)
+                if result is None:
+                    result = await player.get_music_list(search_type, search_id)
 
         if result and result.get("array"):
             can_expand = child_media_class != MediaClass.MUSIC
@@ -134,12 +157,17 @@ async def build_item_response(entity, payload):
     else:
         child_media_class = MediaClass.MOVIE
         if "*" in search_id:
-            result = to_data_list(
-                await player.search_movies(search_id.replace("*", ""), search_type)
-            )
+            query = search_id.replace("*", "")
+            result = search_index.search_movies(query, search_type)
+            if result is None:
+                result = to_data_list(await player.search_movies(query, search_type))
+            elif not result["data"]:
+                result = None  # no matches
             title = search_id
         elif search_id in ZVIDEO_FILTER_TYPES:
-            result = await player.get_movie_list(search_id, BROWSE_LIMIT)
+            result = entity.coordinator.video_library.view(search_id)
+            if result is None:
+                result = await player.get_movie_list(search_id, BROWSE_LIMIT)
             shortcut = get_shortcut_name(search_id)
             if shortcut:
                 title = shortcut
@@ -202,6 +230,87 @@ async def build_item_response(entity, payload):
     )
 
 
+async def build_search_response(entity, search_id):
+    """Create response payload for a unified video and music search."""
+    query = search_id.replace("*", "") if "*" in search_id else ""
+    player = entity.coordinator.player
+    search_index = entity.coordinator.search_index
+    is_internal = is_internal_request(entity.hass)
+
+    # use the local index where available and search the player for the rest
+    results = []
+    sources = []
+    for source in ZSEARCH_SOURCES if query else []:
+        if source == "video":
+            response = search_index.search_movies(query)
+            items = response and response["data"]
+        else:
+            response = search_index.search_music(query, source)
+            items = response and response["array"]
+        if response is None:
+            sources.append(source)
+        else:
+            results.extend({"source": source, "item": item} for item in items)
+    if sources:
+        results.extend(await player.search(query, sources))
+    results = rank_search_results(query, results)
+
+    children = []
+    songs = []
+    for result in results:
+        item = result["item"]
+        if result["source"] == "video":
+            child_type = item["type"]
+            item_id = item["id"]
+            item_type = ZTYPE_MEDIA_TYPE.get(child_type, MediaType.VIDEO)
+            if child_type == 0:
+                item_id = item["aggregationId"]
+            children.append(
+                BrowseMedia(
+                    title=item["name"],
+                    media_class=ZTYPE_MEDIA_CLASS.get(child_type, MediaClass.VIDEO),
+                    media_content_id=str(item_id),
+                    media_content_type=item_type,
+                    can_play=child_type in {1, 5, 6},
+                    can_expand=child_type in {2, 3, 4, 6},
+                    thumbnail=get_thumbnail_url(
+                        item_type, item_id, entity, is_internal
+                    ),
+                )
+            )
+            continue
+        item_type = result["source"]
+        item_name = item.get("name")
+        if item_name is None:
+            item_name = "{} - {}".format(item.get("artist"), item.get("title"))
+        if item_type == MediaType.MUSIC:
+            songs.append(item)
+        children.append(
+            BrowseMedia(
+                title=item_name,
+                media_class=ITEM_TYPE_MEDIA_CLASS[item_type],
+                media_content_id=str(item["id"]),
+                media_content_type=item_type,
+                can_play=True,
+                can_expand=item_type != MediaType.MUSIC,
+                thumbnail=get_thumbnail_url(item_type, item["id"], entity, is_internal),
+            )
+        )
+    if songs:
+        player.set_song_list(songs)
+
+    return BrowseMedia(
+        title=search_id,
+        media_class=MediaClass.DIRECTORY,
+        children_media_class=None,
+        media_content_id=search_id,
+        media_content_type=MEDIA_TYPE_SEARCH,
+        can_play=False,
+        children=children,
+        can_expand=True,
+    )
+
+
 def to_data_list(response):
     """Converts the serach response to a data list."""
     data_list = []
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+
 import voluptuous as vol
 
 from homeassistant.components import media_source
@@ -116,6 +118,29 @@ async def async_setup_entry(
     async_add_entities([ZidooMediaPlayer(coordinator, config_entry)])
 
 
+def zidoo_command(func):
+    """Decorate entity commands to poll rapidly for their result.
+
+    A command that fails, by raising or returning a false result, rolls back
+    its optimistic state instead.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        try:
+            result = await func(self, *args, **kwargs)
+        except Exception:
+            self.coordinator.async_cancel_optimistic()
+            raise
+        if not result:
+            self.coordinator.async_cancel_optimistic()
+            return result
+        await self.coordinator.async_command_sent()
+        return result
+
+    return wrapper
+
+
 class ZidooEntity(CoordinatorEntity[ZidooCoordinator]):
     """Zidoo entity class."""
 
@@ -238,7 +263,7 @@ class ZidooMediaPlayer(ZidooEntity, MediaPlayerEntity):
     @property
     def media_position(self):
         """Position of current playing media in seconds."""
-        position = self.coordinator.media_info.get("position")
+        position = self.coordinator.media_position
         if position:
             return float(position) / 1000
         return None
@@ -286,38 +311,45 @@ class ZidooMediaPlayer(ZidooEntity, MediaPlayerEntity):
     #    """Set volume level, range 0..1."""
     #    self.coordinator.player.set_volume_level(volume)
 
+    @zidoo_command
     async def async_turn_on(self):
         """Turn the media player on."""
-        await self.coordinator.async_turn_on(
+        return await self.coordinator.async_turn_on(
             event_data={
                 ATTR_ENTITY_ID: self.entity_id,
                 ATTR_DEVICE_ID: self.device_entry.id,
             }
         )
 
+    @zidoo_command
     async def async_turn_off(self):
         """Turn off media player."""
-        await self.coordinator.async_turn_off()
+        return await self.coordinator.async_turn_off()
 
+    @zidoo_command
     async def async_volume_up(self):
         """Volume up the media player."""
-        await self.coordinator.player.volume_up()
+        return await self.coordinator.player.volume_up()
 
+    @zidoo_command
     async def async_volume_down(self):
         """Volume down media player."""
-        await self.coordinator.player.volume_down()
+        return await self.coordinator.player.volume_down()
 
+    @zidoo_command
     async def async_mute_volume(self, mute):
         """Send mute command."""
-        await self.coordinator.player.mute_volume()
+        return await self.coordinator.player.mute_volume()
 
+    @zidoo_command
     async def async_select_sound_mode(self, sound_mode):
         """Set the audio output source."""
-        await self.coordinator.async_set_audio_output(sound_mode)
+        return await self.coordinator.async_set_audio_output(sound_mode)
 
+    @zidoo_command
     async def async_select_source(self, source):
         """Set the input source."""
-        await self.coordinator.player.start_app(source)
+        return await self.coordinator.player.start_app(source)
 
     async def async_media_play_pause(self):
         """Simulate play pause media player."""
@@ -325,28 +357,36 @@ class ZidooMediaPlayer(ZidooEntity, MediaPlayerEntity):
             return await self.async_media_pause()
         return await self.async_media_play()
 
+    @zidoo_command
     async def async_media_play(self):
         """Send play command."""
+        self.coordinator.async_set_optimistic(state=MediaPlayerState.PLAYING)
         return await self.coordinator.player.media_play()
 
+    @zidoo_command
     async def async_media_pause(self):
         """Send media pause command."""
+        self.coordinator.async_set_optimistic(state=MediaPlayerState.PAUSED)
         return await self.coordinator.player.media_pause()
 
+    @zidoo_command
     async def async_media_stop(self):
         """Send media stop command."""
         return await self.coordinator.player.media_stop()
 
+    @zidoo_command
     async def async_media_next_track(self):
         """Send next track command."""
         return await self.coordinator.player.media_next_track()
         # self.schedule_update_ha_state()
 
+    @zidoo_command
     async def async_media_previous_track(self):
         """Send the previous track command."""
         return await self.coordinator.player.media_previous_track()
         # self.schedule_update_ha_state()
 
+    @zidoo_command
     async def async_play_media(self, media_type, media_id, **kwargs):
         """Play a piece of media."""
         _LOGGER.debug("play request: media_id:%s media_type:%s", media_id, media_type)
@@ -359,44 +399,50 @@ class ZidooMediaPlayer(ZidooEntity, MediaPlayerEntity):
 
         _LOGGER.debug("play: media_id:%s media_type:%s", media_id, media_type)
         if media_type and media_type == "file":
-            await self.coordinator.player.play_file(media_id)
-        elif media_type in ZMUSIC_SEARCH_TYPES:
+            return await self.coordinator.player.play_file(media_id)
+        if media_type in ZMUSIC_SEARCH_TYPES:
             media_ids = media_id.split(",")
-            await self.coordinator.player.play_music(
+            return await self.coordinator.player.play_music(
                 media_ids[0], media_type, media_ids[-1]
             )
-        elif "/" in media_type:
-            await self.coordinator.player.play_stream(media_id, media_type)
-        else:
-            await self.coordinator.player.play_movie(media_id)
+        if "/" in media_type:
+            return await self.coordinator.player.play_stream(media_id, media_type)
+        return await self.coordinator.player.play_movie(media_id)
 
+    @zidoo_command
     async def async_media_seek(self, position):
         """Send media_seek command to media player."""
-        await self.coordinator.player.set_media_position(float(position) * 1000)
+        position = float(position) * 1000
+        self.coordinator.async_set_optimistic(position=position)
+        return await self.coordinator.player.set_media_position(position)
 
     @property
     def media_image_url(self):
         """Image url of current playing media."""
         return self.coordinator.player.generate_current_image_url()
 
+    @zidoo_command
     async def async_set_subtitle(self, index=None):
         """Sets or toggles the video subtitle."""
-        await self.coordinator.player.set_subtitle(index)
+        return await self.coordinator.player.set_subtitle(index)
 
+    @zidoo_command
     async def async_set_audio(self, index=None):
         """Sets or toggles the audio_track subtitle."""
-        await self.coordinator.player.set_audio(index)
+        return await self.coordinator.player.set_audio(index)
 
+    @zidoo_command
     async def async_set_zoom(self, mode=None):
         """Sets or toggles the audio_track subtitle."""
-        await self.coordinator.player.set_zoom(mode)
+        return await self.coordinator.player.set_zoom(mode)
 
+    @zidoo_command
     async def async_send_key(self, key):
         """Send a remote control key command."""
         _LOGGER.warning(
             "'Zidoo:Send Keys' is depreciated.  Please update to use 'Remote:Send command'"
         )
-        await self.coordinator.player._send_key(key)
+        return await self.coordinator.player._send_key(key)
 
     async def async_browse_media(self, media_content_type=None, media_content_id=None):
         """Implement the websocket media browsing helper."""
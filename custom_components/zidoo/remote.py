@@ -23,7 +23,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import _LOGGER, DOMAIN
-from .media_player import ZidooEntity
+from .media_player import ZidooEntity, zidoo_command
 from .zidooaio import ZKEYS
 
 
@@ -53,6 +53,7 @@ class ZidooRemote(ZidooEntity, RemoteEntity):
         """Return the state of the device."""
         return self.coordinator.state
 
+    @zidoo_command
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the media player on."""
         activity = kwargs.get(ATTR_ACTIVITY)
@@ -66,10 +67,12 @@ class ZidooRemote(ZidooEntity, RemoteEntity):
                 }
             )
 
+    @zidoo_command
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off media player."""
         await self.coordinator.async_turn_off()
 
+    @zidoo_command
     async def async_send_command(self, command: Iterable[str], **kwargs: Any) -> None:
         """Send commands to one device."""
         num_repeats = kwargs.get(ATTR_NUM_REPEATS, DEFAULT_NUM_REPEATS)
@@ -0,0 +1,161 @@
+"""Local search index of the Zidoo media library."""
+
+from __future__ import annotations
+
+from collections import Counter
+import re
+from typing import Final
+import unicodedata
+
+from .zidooaio import ZTYPE_COLLECTION, ZTYPE_MOVIE, ZTYPE_TV_SHOW, ZTYPE_VIDEO
+
+SEARCH_LIMIT: Final = 250  # results per search, as the player search
+SEARCH_MIN_MATCH: Final = 0.5  # share of query trigrams a name must contain
+SEARCH_MIN_MATCH_SHORT: Final = 0.4  # share for short queries, a typo costs more
+SEARCH_SHORT_QUERY: Final = 6  # longest query (characters) treated as short
+
+SEARCH_FIELDS: Final = {  # item fields searched for each catalog
+    "video": ("name",),
+    "music": ("title", "name", "artist", "album"),
+    "album": ("name", "artist"),
+    "artist": ("name",),
+}
+
+SEARCH_VIDEO_TYPES: Final = {  # video item types of each video search type
+    "movie": {ZTYPE_VIDEO, ZTYPE_MOVIE},
+    "tvshow": {ZTYPE_TV_SHOW},
+    "collection": {ZTYPE_COLLECTION},
+}
+
+
+def normalize(text: str) -> str:
+    """Return text lower cased, without accents and punctuation."""
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return " ".join(re.findall(r"\w+", text.casefold()))
+
+
+def trigrams(text: str) -> set[str]:
+    """Return the trigrams of the words of normalized text."""
+    grams = set()
+    for word in text.split():
+        word = f"  {word} "
+        grams.update(word[i : i + 3] for i in range(len(word) - 2))
+    return grams
+
+
+class ZidooSearchCatalog:
+    """Trigram index of the names of a list of items."""
+
+    def __init__(self, items: list[dict], fields: tuple[str, ...]) -> None:
+        """Build the index.
+
+        Parameters
+            items: list
+                library items
+            fields: tuple
+                item fields searched
+        """
+        self.items = items
+        self.texts = []
+        self.grams = []
+        self.index: dict[str, list[int]] = {}
+        for position, item in enumerate(items):
+            text = normalize(
+                " ".join(str(item[field]) for field in fields if item.get(field))
+            )
+            grams = trigrams(text)
+            self.texts.append(text)
+            self.grams.append(len(grams))
+            for gram in grams:
+                self.index.setdefault(gram, []).append(position)
+
+    def search(
+        self, query: str, types: set | None = None, limit: int = SEARCH_LIMIT
+    ) -> list[dict]:
+        """Return the items matching a query, best match first.
+
+        Items are ranked on the share of query trigrams they contain, so
+        typos still match, with exact and leading matches first and shorter
+        names before longer ones.
+        """
+        query = normalize(query)
+        query_grams = trigrams(query)
+        if not query_grams:
+            return []
+        matches = Counter()
+        for gram in query_grams:
+            matches.update(self.index.get(gram, ()))
+
+        # a swap of two letters breaks up to 3 of the few trigrams of a short query
+        min_match = (
+            SEARCH_MIN_MATCH_SHORT
+            if len(query) <= SEARCH_SHORT_QUERY
+            else SEARCH_MIN_MATCH
+        )
+        ranked = []
+        for position, common in matches.items():
+            match = common / len(query_grams)
+            if match < min_match:
+                continue
+            item = self.items[position]
+            if types is not None and item.get("type") not in types:
+                continue
+            text = self.texts[position]
+            if query in text:
+                match += 1.5 if text.startswith(query) else 1
+            similarity = 2 * common / (len(query_grams) + self.grams[position])
+            ranked.append((match, similarity, position))
+        ranked.sort(reverse=True)
+        return [self.items[position] for _, _, position in ranked[:limit]]
+
+
+class ZidooSearchIndex:
+    """Local search of the mirrored library catalogs.
+
+    Searches return None while a catalog is not indexed, so callers can fall
+    back to the player search.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._catalogs: dict[str, ZidooSearchCatalog] = {}
+
+    def update(self, catalogs: dict[str, list[dict]]) -> None:
+        """Rebuild the index from the items of each catalog (see SEARCH_FIELDS)."""
+        self._catalogs = {
+            catalog: ZidooSearchCatalog(items, SEARCH_FIELDS[catalog])
+            for catalog, items in catalogs.items()
+        }
+
+    def stats(self) -> dict:
+        """Return indexed item counts."""
+        return {catalog: len(index.items) for catalog, index in self._catalogs.items()}
+
+    def search_movies(self, query: str, search_type: str = "video") -> dict | None:
+        """Return video matching a query as a getAggregations response.
+
+        Parameters
+            query: str
+                text to search
+            search_type: str
+                see ZVIDEO_SEARCH_TYPES
+        """
+        catalog = self._catalogs.get("video")
+        if catalog is None:
+            return None
+        return {"data": catalog.search(query, SEARCH_VIDEO_TYPES.get(search_type))}
+
+    def search_music(self, query: str, search_type: str = "music") -> dict | None:
+        """Return music matching a query as a MusicControl response.
+
+        Parameters
+            query: str
+                text to search
+            search_type: str
+                see ZMUSIC_SEARCH_TYPES
+        """
+        catalog = self._catalogs.get(search_type)
+        if catalog is None:
+            return None
+        return {"array": catalog.search(query)}
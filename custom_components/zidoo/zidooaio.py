@@ -6,15 +6,36 @@ References:
 """
 
 import asyncio
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator
+import contextlib
 from datetime import datetime
+import functools
+import heapq
+import itertools
+import json
 import logging
+import random
+import re
 import socket
 import struct
+from typing import ClassVar
 import urllib.parse
+import zlib
 
-from aiohttp import ClientError, ClientSession, CookieJar
+from aiohttp import ClientError, ClientSession, CookieJar, TCPConnector, TraceConfig
 from yarl import URL
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
 _LOGGER = logging.getLogger(__name__)
 
 VERSION = "0.4.2"
@@ -22,8 +43,38 @@ TIMEOUT = 5  # default timeout
 TIMEOUT_INFO = 1  # for playing info
 TIMEOUT_SEARCH = 10  # for searches
 RETRIES = 3  # default retries
+RETRY_BACKOFF = 0.25  # first retry delay in seconds (doubles each retry)
+RETRY_BACKOFF_MAX = 2  # retry delay limit in seconds
+RETRY_BUDGET = 10  # total seconds for a call including retries
+RETRY_BUDGET_FACTOR = 2  # call budget as a multiple of its timeout hint
+TIMEOUT_MIN = 0.5  # lowest derived timeout
+LATENCY_ALPHA = 0.2  # latency EWMA smoothing factor
+LATENCY_SAMPLES = 50  # latency samples kept per endpoint for p95
+LATENCY_MIN_SAMPLES = 5  # samples needed before timeouts are derived
+PAGE_COUNT_PARAM = re.compile(r"&(?:count|requestCount|pagesize)=(\d+)")  # page size
+BREAKER_THRESHOLD = 3  # consecutive failed calls before the circuit opens
+BREAKER_COOLDOWN = 5  # seconds before an open circuit is probed
+BREAKER_COOLDOWN_MAX = 60  # cooldown limit after repeated failed probes
+TIMEOUT_PROBE = 0.5  # reachability probe timeout
+NEIGHBOR_TABLE = "/proc/net/arp"  # neighbor (ARP) table checked by probes
+SCHEDULER_LIMIT = 3  # concurrent requests per player (one reserved for interactive)
+FANOUT_LIMIT = SCHEDULER_LIMIT - 1  # fan-out sub-calls, the background request slots
+TIMEOUT_FANOUT = 10  # fan-out sub-call timeout
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)  # histogram bounds (seconds)
+JSON_EXECUTOR_SIZE = 256 * 1024  # response bytes above which decoding runs in executor
 CONF_PORT = 9529  # default api port
 DEFAULT_COUNT = 250  # default list limit
+SONG_QUEUE_LIMIT = DEFAULT_COUNT  # songs sent to playMusics from the queued list
+PAGE_SIZE = 100  # first page size of paged lists
+PAGE_SIZE_MIN = 25  # smallest adapted page size
+PAGE_SIZE_MAX = 500  # largest adapted page size
+PAGE_LATENCY = 0.5  # target seconds per page the page size adapts to
+AUDIO_OUTPUT_TTL = 60  # seconds the audio output list and index are cached
+MEDIA_CACHE_SIZE = 200  # file paths kept in the media metadata cache
+POOL_LIMIT = 100  # total connections shared by all players
+POOL_LIMIT_PER_HOST = 4  # connections per player
+POOL_KEEPALIVE = 30  # idle seconds before a pooled connection is closed
+POOL_DNS_TTL = 300  # dns cache expiry in seconds
 ZCMD_STATUS = "getPlayStatus"
 
 """Remote Control Button keys"""
@@ -223,6 +274,9 @@ ZVIDEO_SEARCH_TYPES = {
 
 ZMUSIC_SEARCH_TYPES = {"music": 0, "album": 1, "artist": 2, "playlist": 3}
 
+"""Unified search sources (see ZidooRC.search)"""
+ZSEARCH_SOURCES = ["video", "music", "album", "artist"]
+
 """File System devicce type names"""
 ZDEVICE_FOLDER = 1000
 ZDEVICE_NAMES = {
@@ -278,6 +332,22 @@ ZSTATE_STOPPED = 0
 ZSTATE_PLAYING = 1
 ZSTATE_PAUSED = 2
 
+"""Request priorities (lower runs first)"""
+ZPRIORITY_INTERACTIVE = 0  # user commands
+ZPRIORITY_STATUS = 1  # status polls
+ZPRIORITY_BACKGROUND = 2  # library browsing and warm up
+
+"""Circuit breaker states"""
+ZBREAKER_CLOSED = "closed"
+ZBREAKER_OPEN = "open"
+ZBREAKER_HALF_OPEN = "half_open"
+
+"""Device warm up states"""
+ZINIT_IDLE = "idle"
+ZINIT_RUNNING = "running"
+ZINIT_DONE = "done"
+ZINIT_CANCELLED = "cancelled"
+
 
 def NUM_STR(num, dec, dimen):
     """Converts to a number to k/K or M (bps/Hz)."""
@@ -297,10 +367,637 @@ def NUM_STR(num, dec, dimen):
     return str(num) + " " + dimen
 
 
+def json_decoder():
+    """Return the fastest available json decoder (orjson, msgspec or stdlib)."""
+    if orjson is not None:
+        return orjson.loads
+    if msgspec is not None:
+        return msgspec.json.decode
+    return json.loads
+
+
+JSON_DECODE_ERRORS = (ValueError, TypeError) + (
+    (msgspec.DecodeError,) if msgspec is not None else ()
+)
+
+
+def _decompress(body: bytes, encoding: str) -> bytes:
+    """Decompress a gzip or deflate encoded response body."""
+    if encoding == "gzip":
+        return zlib.decompress(body, 16 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+
+def _list_items(response: dict | None) -> list | None:
+    """Return the items of a list response (v1 data or v2 array)."""
+    if response is None:
+        return None
+    return response.get("data") or response.get("array")
+
+
+def _list_total(response: dict) -> int | None:
+    """Return the total item count a list response reports, if any."""
+    for key in ("total", "count"):
+        if isinstance(response.get(key), int):
+            return response[key]
+    return None
+
+
+def _list_marker(response: dict) -> list:
+    """Return the first item id and total count of a list response."""
+    items = _list_items(response)
+    return [items[0].get("id") if items else None, _list_total(response)]
+
+
+def _search_rank(query: str, item: dict) -> int:
+    """Return how well a search result name matches a query (lower is better)."""
+    name = str(item.get("name") or item.get("title") or "").casefold()
+    query = query.casefold()
+    if name == query:
+        return 0
+    if name.startswith(query):
+        return 1
+    if f" {query}" in f" {name}":
+        return 2
+    if query in name:
+        return 3
+    return 4
+
+
+def rank_search_results(query: str, results: list[dict]) -> list[dict]:
+    """Return unified search results ordered by name match.
+
+    Results of the same rank keep their order.
+    """
+    return sorted(results, key=lambda result: _search_rank(query, result["item"]))
+
+
+def _neighbor_resolved(ip: str) -> bool | None:
+    """Return True if the neighbor table has resolved an address.
+
+    Returns
+        None if the address (or the table) is unknown
+    """
+    try:
+        with open(NEIGHBOR_TABLE, encoding="ascii") as table:
+            next(table, None)  # header
+            for line in table:
+                fields = line.split()
+                if len(fields) > 3 and fields[0] == ip:
+                    return int(fields[2], 16) & 0x2 != 0  # ATF_COM
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+class ZidooListError(Exception):
+    """A page of a streamed list could not be loaded."""
+
+
+class ZidooConnectionPool:
+    """Shared HTTP connection pool for Zidoo players.
+
+    A single connector is shared by all players on the same event loop so
+    keep-alive connections are reused between polls.  Each player still gets
+    its own session (and cookie jar) on top of the shared connector.
+    """
+
+    _pools: ClassVar[dict[asyncio.AbstractEventLoop, "ZidooConnectionPool"]] = {}
+
+    def __init__(
+        self,
+        limit: int = POOL_LIMIT,
+        limit_per_host: int = POOL_LIMIT_PER_HOST,
+        keepalive_timeout: float = POOL_KEEPALIVE,
+        dns_ttl: int | None = POOL_DNS_TTL,
+    ) -> None:
+        """Initialize the pool.
+
+        Parameters
+            limit: int
+                total simultaneous connections (0 for no limit)
+            limit_per_host: int
+                simultaneous connections to each player
+            keepalive_timeout: float
+                idle seconds before a connection is closed
+            dns_ttl: int
+                dns cache expiry in seconds (None to cache forever)
+        """
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._dns_ttl = dns_ttl
+        self._connector: TCPConnector | None = None
+        self.stats = {"connections_created": 0, "connections_reused": 0}
+
+    @classmethod
+    def get(cls, loop: asyncio.AbstractEventLoop | None = None):
+        """Return the pool shared by all players on the event loop."""
+        if loop is None:
+            loop = asyncio.get_running_loop()
+        pool = cls._pools.get(loop)
+        if pool is None:
+            pool = cls._pools[loop] = cls()
+        return pool
+
+    @property
+    def connector(self) -> TCPConnector:
+        """Shared connector (created on first use)."""
+        if self._connector is None or self._connector.closed:
+            self._connector = TCPConnector(
+                limit=self._limit,
+                limit_per_host=self._limit_per_host,
+                keepalive_timeout=self._keepalive_timeout,
+                use_dns_cache=True,
+                ttl_dns_cache=self._dns_ttl,
+            )
+        return self._connector
+
+    def create_session(self, stats: dict | None = None) -> ClientSession:
+        """Create a player session on the shared connector.
+
+        Parameters
+            stats: dict
+                optional player counters updated with connection reuse
+        """
+        return ClientSession(
+            connector=self.connector,
+            connector_owner=False,
+            auto_decompress=False,  # players decode (and measure) compression
+            cookie_jar=CookieJar(unsafe=True, quote_cookie=False),
+            trace_configs=[self._trace_config(stats)],
+        )
+
+    def _trace_config(self, stats: dict | None) -> TraceConfig:
+        """Build connection counters for a session."""
+
+        def count(key: str) -> None:
+            self.stats[key] += 1
+            if stats is not None:
+                stats[key] = stats.get(key, 0) + 1
+
+        async def on_create(session, context, params) -> None:
+            count("connections_created")
+
+        async def on_reuse(session, context, params) -> None:
+            count("connections_reused")
+
+        trace_config = TraceConfig()
+        trace_config.on_connection_create_end.append(on_create)
+        trace_config.on_connection_reuseconn.append(on_reuse)
+        return trace_config
+
+    async def close(self) -> None:
+        """Async Close all pooled connections and release the pool."""
+        if self._connector is not None:
+            await self._connector.close()
+        self._connector = None
+        for loop, pool in list(self._pools.items()):
+            if pool is self:
+                del self._pools[loop]
+
+
+class ZidooRetryPolicy:
+    """Latency adaptive timeouts and retry backoff for player requests.
+
+    Latency is tracked per endpoint (api path without query) and page size
+    bucket (see latency_key) as an EWMA and a p95 of recent samples.  Once
+    enough samples exist, request timeouts are derived from these instead of
+    the timeout hint given by the call.
+    """
+
+    def __init__(
+        self,
+        timeout: float = TIMEOUT,
+        retries: int = RETRIES,
+        backoff: float = RETRY_BACKOFF,
+        backoff_max: float = RETRY_BACKOFF_MAX,
+        budget: float = RETRY_BUDGET,
+    ) -> None:
+        """Initialize the policy.
+
+        Parameters
+            timeout: float
+                default (and maximum derived) request timeout in seconds
+            retries: int
+                default retries on response errors
+            backoff: float
+                first retry delay in seconds
+            backoff_max: float
+                retry delay limit in seconds
+            budget: float
+                total seconds for a call including retries
+        """
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.budget = budget
+        self._latency: dict[str, dict] = {}
+
+    @staticmethod
+    def endpoint(url: str) -> str:
+        """Return the endpoint (api path without query) of a url."""
+        return url.split("?", 1)[0]
+
+    @staticmethod
+    def latency_key(url: str) -> str:
+        """Return the latency model key of a url.
+
+        Paged requests are keyed by endpoint and the power of ten of their
+        page size, so single item pages do not set the timeout of large ones.
+        """
+        endpoint, _, query = url.partition("?")
+        match = PAGE_COUNT_PARAM.search(f"&{query}")
+        if match is None:
+            return endpoint
+        return f"{endpoint}#{10 ** (len(match.group(1)) - 1)}"
+
+    def record(self, endpoint: str, latency: float) -> None:
+        """Add a latency sample in seconds for an endpoint."""
+        entry = self._latency.get(endpoint)
+        if entry is None:
+            entry = {"ewma": latency, "samples": deque(maxlen=LATENCY_SAMPLES)}
+            self._latency[endpoint] = entry
+        else:
+            entry["ewma"] += LATENCY_ALPHA * (latency - entry["ewma"])
+        entry["samples"].append(latency)
+
+    def ewma(self, endpoint: str) -> float | None:
+        """Return the smoothed latency of an endpoint."""
+        entry = self._latency.get(endpoint)
+        return entry["ewma"] if entry else None
+
+    def p95(self, endpoint: str) -> float | None:
+        """Return the 95th percentile latency of recent samples."""
+        entry = self._latency.get(endpoint)
+        if not entry:
+            return None
+        samples = sorted(entry["samples"])
+        return samples[int(0.95 * (len(samples) - 1))]
+
+    def get_timeout(self, endpoint: str, hint: float | None = None) -> float:
+        """Return the request timeout for an endpoint.
+
+        Parameters
+            endpoint: str
+                api path
+            hint: float
+                timeout used until enough latency samples exist, and the
+                limit of derived timeouts
+        """
+        default = hint or self.timeout
+        entry = self._latency.get(endpoint)
+        if entry is None or len(entry["samples"]) < LATENCY_MIN_SAMPLES:
+            return default
+        derived = max(entry["ewma"] * 3, self.p95(endpoint) * 1.5)
+        return min(max(derived, TIMEOUT_MIN), default)
+
+    def get_backoff(self, attempt: int) -> float:
+        """Return the jittered exponential delay before a retry."""
+        delay = min(self.backoff * 2**attempt, self.backoff_max)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def get_budget(self, hint: float | None = None) -> float:
+        """Return the total seconds allowed for a call.
+
+        Calls with a timeout hint get a multiple of it, so short status
+        calls keep a short budget, and at least one full attempt.
+        """
+        if not hint:
+            return self.budget
+        return max(hint, min(self.budget, hint * RETRY_BUDGET_FACTOR))
+
+    def stats(self) -> dict:
+        """Return the latency estimates per endpoint."""
+        return {
+            endpoint: {
+                "ewma": round(entry["ewma"], 3),
+                "p95": round(self.p95(endpoint), 3),
+                "timeout": round(self.get_timeout(endpoint), 3),
+            }
+            for endpoint, entry in self._latency.items()
+        }
+
+
+class ZidooMetrics:
+    """Per endpoint request counters and latency histograms."""
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self._endpoints: dict[str, dict] = {}
+
+    def _get(self, endpoint: str) -> dict:
+        entry = self._endpoints.get(endpoint)
+        if entry is None:
+            entry = {
+                "requests": 0,
+                "errors": 0,
+                "timeouts": 0,
+                "retries": 0,
+                "status_804": 0,
+                "bytes": 0,
+                "latency_total": 0.0,
+                "histogram": [0] * (len(LATENCY_BUCKETS) + 1),
+            }
+            self._endpoints[endpoint] = entry
+        return entry
+
+    def record(self, endpoint: str, latency: float, size: int = 0, status=None) -> None:
+        """Count an answered request.
+
+        Parameters
+            endpoint: str
+                api path
+            latency: float
+                seconds until the response was decoded
+            size: int
+                response bytes received
+            status:
+                api status of the response
+        """
+        entry = self._get(endpoint)
+        entry["requests"] += 1
+        entry["bytes"] += size
+        entry["latency_total"] += latency
+        bucket = 0
+        while bucket < len(LATENCY_BUCKETS) and latency > LATENCY_BUCKETS[bucket]:
+            bucket += 1
+        entry["histogram"][bucket] += 1
+        if status == 804:
+            entry["status_804"] += 1
+
+    def record_error(self, endpoint: str, timeout: bool = False) -> None:
+        """Count a request without a valid response."""
+        entry = self._get(endpoint)
+        entry["requests"] += 1
+        entry["timeouts" if timeout else "errors"] += 1
+
+    def record_retry(self, endpoint: str) -> None:
+        """Count a retried request."""
+        self._get(endpoint)["retries"] += 1
+
+    def stats(self) -> dict:
+        """Return the counters per endpoint."""
+        labels = [f"<={bound}s" for bound in LATENCY_BUCKETS]
+        labels.append(f">{LATENCY_BUCKETS[-1]}s")
+        stats = {}
+        for endpoint, entry in self._endpoints.items():
+            answered = sum(entry["histogram"])
+            stats[endpoint] = {
+                key: entry[key]
+                for key in ("requests", "errors", "timeouts", "retries", "status_804")
+            }
+            stats[endpoint]["bytes_received"] = entry["bytes"]
+            stats[endpoint]["latency_avg"] = (
+                round(entry["latency_total"] / answered, 3) if answered else None
+            )
+            stats[endpoint]["latency_histogram"] = dict(
+                zip(labels, entry["histogram"], strict=True)
+            )
+        return stats
+
+
+class ZidooRequestScheduler:
+    """Per device request scheduler.
+
+    Limits concurrent requests to a player and runs queued requests in
+    priority order, so user commands do not wait behind library fetches.
+    One slot is kept free of background requests for interactive use.
+    """
+
+    def __init__(self, limit: int = SCHEDULER_LIMIT) -> None:
+        """Initialize the scheduler.
+
+        Parameters
+            limit: int
+                concurrent requests to the player
+        """
+        self._limit = limit
+        self._active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+    def _capacity(self, priority: int) -> int:
+        if priority >= ZPRIORITY_BACKGROUND:
+            return max(self._limit - 1, 1)
+        return self._limit
+
+    def _wake(self) -> None:
+        while self._waiters:
+            priority, _, waiter = self._waiters[0]
+            if waiter.done():  # cancelled
+                heapq.heappop(self._waiters)
+                continue
+            if self._active >= self._capacity(priority):
+                return
+            heapq.heappop(self._waiters)
+            self._active += 1
+            waiter.set_result(None)
+
+    async def acquire(self, priority: int = ZPRIORITY_INTERACTIVE) -> None:
+        """Async Wait for a request slot."""
+        if (
+            not self._waiters or self._waiters[0][0] > priority
+        ) and self._active < self._capacity(priority):
+            self._active += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Release a request slot."""
+        self._active -= 1
+        self._wake()
+
+    @contextlib.asynccontextmanager
+    async def slot(self, priority: int = ZPRIORITY_INTERACTIVE):
+        """Async Context holding a request slot."""
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    @property
+    def queued(self) -> int:
+        """Number of waiting requests."""
+        return sum(1 for _, _, waiter in self._waiters if not waiter.done())
+
+
+class ZidooCircuitBreaker:
+    """Per device circuit breaker.
+
+    Opens after repeated calls without any response from the player, so calls
+    are rejected immediately while it is off.  Once the cooldown expires, the
+    circuit is half-open until a single cheap probe closes or re-opens it.
+    """
+
+    def __init__(
+        self,
+        threshold: int = BREAKER_THRESHOLD,
+        cooldown: float = BREAKER_COOLDOWN,
+        cooldown_max: float = BREAKER_COOLDOWN_MAX,
+    ) -> None:
+        """Initialize the breaker.
+
+        Parameters
+            threshold: int
+                consecutive failed calls before the circuit opens
+            cooldown: float
+                seconds before an open circuit is probed
+            cooldown_max: float
+                cooldown limit as failed probes double the cooldown
+        """
+        self.state = ZBREAKER_CLOSED
+        self._threshold = threshold
+        self._cooldown_min = cooldown
+        self._cooldown_max = cooldown_max
+        self._cooldown = cooldown
+        self._failures = 0
+        self._opened_at = 0.0
+
+    def _now(self) -> float:
+        return asyncio.get_running_loop().time()
+
+    def probe_due(self) -> bool:
+        """Return True (and go half-open) when an open circuit should be probed."""
+        if self.state != ZBREAKER_OPEN:
+            return False
+        if self._now() - self._opened_at < self._cooldown:
+            return False
+        _LOGGER.debug("Circuit half-open, probing player")
+        self.state = ZBREAKER_HALF_OPEN
+        return True
+
+    def record_success(self) -> None:
+        """Close the circuit after a response from the player."""
+        if self.state != ZBREAKER_CLOSED:
+            _LOGGER.debug("Circuit closed")
+        self.state = ZBREAKER_CLOSED
+        self._failures = 0
+        self._cooldown = self._cooldown_min
+
+    def record_failure(self) -> None:
+        """Count a call without response and open the circuit when required."""
+        self._failures += 1
+        if self.state == ZBREAKER_HALF_OPEN:
+            self._cooldown = min(self._cooldown * 2, self._cooldown_max)
+        elif self.state == ZBREAKER_OPEN or self._failures < self._threshold:
+            return
+        _LOGGER.debug("Circuit open for %.1fs", self._cooldown)
+        self.state = ZBREAKER_OPEN
+        self._opened_at = self._now()
+
+    def reset(self) -> None:
+        """Allow a probe on the next call (e.g. after a power on request)."""
+        if self.state == ZBREAKER_OPEN:
+            self._opened_at = self._now() - self._cooldown
+
+
+class ZidooMediaCache:
+    """LRU cache of video metadata by file path.
+
+    Saves a getAggregationOfFile lookup each time known media starts playing.
+    Entries are tied to a library fingerprint and dropped when it changes.
+    """
+
+    def __init__(self, size: int = MEDIA_CACHE_SIZE) -> None:
+        """Initialize the cache.
+
+        Parameters
+            size: int
+                file paths kept before the least recently used is dropped
+        """
+        self._size = size
+        self._items: OrderedDict[str, tuple[int, dict]] = OrderedDict()
+        self.fingerprint = None
+        self.revision = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, path: str) -> tuple[int, dict] | None:
+        """Return (movie_id, movie_info) for a path, None if not cached."""
+        item = self._items.get(path)
+        if item is not None:
+            self._items.move_to_end(path)
+        return item
+
+    def put(self, path: str, movie_id: int, movie_info: dict) -> None:
+        """Add or refresh the metadata of a path."""
+        self._items[path] = (movie_id, movie_info)
+        self._items.move_to_end(path)
+        while len(self._items) > self._size:
+            self._items.popitem(last=False)
+        self.revision += 1
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        if self._items:
+            self._items.clear()
+            self.revision += 1
+
+    def validate(self, fingerprint) -> None:
+        """Drop all entries if the library fingerprint has changed."""
+        if fingerprint is None or fingerprint == self.fingerprint:
+            return
+        if self.fingerprint is not None:
+            _LOGGER.debug("Library changed, clearing media cache")
+            self.clear()
+        self.fingerprint = fingerprint
+        self.revision += 1
+
+    def export(self) -> dict:
+        """Return the cache as json serializable data."""
+        items = []
+        for path, (movie_id, movie_info) in self._items.items():
+            info = dict(movie_info)
+            if isinstance(info.get("date"), datetime):
+                info["date"] = info["date"].isoformat()
+            items.append([path, movie_id, info])
+        return {"fingerprint": self.fingerprint, "items": items}
+
+    def restore(self, data: dict | None) -> None:
+        """Load data created by export."""
+        if not data:
+            return
+        self._items.clear()
+        self.fingerprint = data.get("fingerprint")
+        for path, movie_id, info in data.get("items", [])[-self._size :]:
+            if info.get("date"):
+                try:
+                    info["date"] = datetime.fromisoformat(info["date"])
+                except (TypeError, ValueError):
+                    info.pop("date")
+            self._items[path] = (movie_id, info)
+
+
 class ZidooRC:
     """Zidoo Media Player Remote Control."""
 
-    def __init__(self, host: str, psk: str = "", mac: str = "") -> None:
+    def __init__(
+        self,
+        host: str,
+        psk: str = "",
+        mac: str = "",
+        pool: ZidooConnectionPool | None = None,
+        retry_policy: ZidooRetryPolicy | None = None,
+        json_loads=None,
+        audio_output_ttl: float = AUDIO_OUTPUT_TTL,
+        media_cache: ZidooMediaCache | None = None,
+    ) -> None:
         """Initialize the Zidoo class.
 
         Parameters
@@ -310,12 +1007,31 @@ class ZidooRC:
                 address is optional and can be used to manually assign the WOL address.
             psk:
                 authorization password key.  If not assigned, standard basic auth is used.
+            pool:
+                connection pool.  If not assigned, the event loop shared pool is used.
+            retry_policy:
+                request timeout and retry policy.  If not assigned, defaults are used.
+            json_loads:
+                json decoder function.  If not assigned, the fastest installed is used.
+            audio_output_ttl:
+                seconds the audio output list and index are cached.
+            media_cache:
+                video metadata cache.  If not assigned, a new cache is used.
         """
 
+        self._ip = host
         self._host = f"{host}:{CONF_PORT}"
         self._mac = mac
         self._psk = psk
+        self._pool = pool
+        self._retry_policy = retry_policy or ZidooRetryPolicy()
+        self._breaker = ZidooCircuitBreaker()
+        self._scheduler = ZidooRequestScheduler()
+        self._metrics = ZidooMetrics()
+        self._json_loads = json_loads or json_decoder()
         self._session: ClientSession | None = None
+        self._connection_stats = {"connections_created": 0, "connections_reused": 0}
+        self._inflight: dict[tuple, asyncio.Future] = {}
         self._cookies = None
         self._content_mapping = []
         self._current_source = ""
@@ -325,41 +1041,154 @@ class ZidooRC:
         self._music_id = -1
         self._music_type = -1
         self._last_video_path = None
+        self._track_path = None
+        self._track_lists: dict[str, dict] = {}
         self._movie_info = {}
+        self._media_cache = media_cache or ZidooMediaCache()
         self._current_subtitle = 0
         self._current_audio = 0
         self._current_zoom: int = 0
         self._current_playmode = 0
         self._song_list = []
         self._audio_output_list = []
+        self._audio_output_index = 0
+        self._audio_output_ttl = audio_output_ttl
+        self._audio_output_expires = 0.0
+        self._init_task: asyncio.Task | None = None
+        self._init_progress = {"state": ZINIT_IDLE, "steps": 0, "done": 0}
+
+    def _start_init(self) -> None:
+        """Start device warm up in the background."""
+        self._cancel_init()
+        self._init_progress = {"state": ZINIT_RUNNING, "steps": 4, "done": 0}
+        self._init_task = asyncio.get_running_loop().create_task(
+            self._init_device(), name=f"zidoo init {self._host}"
+        )
+        self._init_task.add_done_callback(
+            functools.partial(self._init_done, self._init_progress)
+        )
+
+    def _init_done(self, progress: dict, task: asyncio.Task) -> None:
+        """Record the end of a device warm up."""
+        if task.cancelled():
+            progress["state"] = ZINIT_CANCELLED
+            return
+        if task.exception() is not None:
+            _LOGGER.debug("Device warm up failed: %s", str(task.exception()))
+        progress["state"] = ZINIT_DONE
+
+    def _cancel_init(self) -> asyncio.Task | None:
+        """Cancel a running device warm up and return its task."""
+        task, self._init_task = self._init_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            return task
+        return None
+
+    def _init_step(self, call):
+        """Wrap a warm up call to count its progress."""
+        progress = self._init_progress
+
+        async def run():
+            try:
+                return await call()
+            finally:
+                progress["done"] += 1
+
+        return run
+
+    @property
+    def init_progress(self) -> dict:
+        """Device warm up state (see ZINIT states) and steps done."""
+        return dict(self._init_progress)
 
     async def _init_device(self):
         """Initialize device on connect."""
         # attempt to force network update
         # await self._req_json("ZidooFileControl/v2/searchUpnp")
-        response = await self._req_json("ZidooFileControl/v2/getSavedSmbDevices")
+        response = await self._init_step(
+            functools.partial(
+                self._req_json,
+                "ZidooFileControl/v2/getSavedSmbDevices",
+                priority=ZPRIORITY_BACKGROUND,
+            )
+        )()
         if response:
             # attempt connection to each saved network share
             data = response.get("data")
             if data and data["count"] > 0:
-                for item in data["list"]:
-                    url = urllib.parse.quote(item.get("url"), safe="")
-                    await self._req_json(
-                        f"ZidooFileControl/v2/getFiles?requestCount=100&startIndex=0&sort=0&url={url}"
-                    )
+                self._init_progress["steps"] += len(data["list"])
+                await self._gather(
+                    [
+                        self._init_step(
+                            functools.partial(
+                                self._req_json,
+                                "ZidooFileControl/v2/getFiles?requestCount=100&startIndex=0&sort=0&url="
+                                + urllib.parse.quote(item.get("url"), safe=""),
+                                priority=ZPRIORITY_BACKGROUND,
+                            )
+                        )
+                        for item in data["list"]
+                    ]
+                )
         # _LOGGER.debug(response)
         # await self._req_json("ZidooFileControl/v2/getUpnpDevices")
 
         # gets current song list (and appears to initialize network shared on old devices)
-        await self.get_music_playlist()
+        # get audio_output_list to initialize v1/v2 alternative
+        # get library fingerprint to validate cached media metadata
+        results = await self._gather(
+            [
+                self._init_step(self.get_music_playlist),
+                self._init_step(self.get_audio_output),
+                self._init_step(
+                    functools.partial(self.get_library_fingerprint, ["video"])
+                ),
+            ]
+        )
+        if results[2]:
+            self._media_cache.validate(results[2].get("video"))
         _LOGGER.debug("SONG_LIST: %s", self._song_list)
 
-        # get audio_output_list to initialize v1/v2 alternative
-        await self.get_audio_output()
+    async def _gather(
+        self,
+        calls: list,
+        limit: int = FANOUT_LIMIT,
+        timeout: float = TIMEOUT_FANOUT,
+    ) -> list:
+        """Async Run calls concurrently with partial results.
+
+        Parameters
+            calls: list
+                functions returning the coroutine of each sub-call
+            limit: int
+                concurrent sub-calls
+            timeout: float
+                timeout for each sub-call in seconds
+        Returns
+            list
+                results in call order (None for failed or timed out calls)
+        """
+        semaphore = asyncio.Semaphore(limit)
+
+        async def run(call):
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(call(), timeout)
+                except TimeoutError:
+                    _LOGGER.debug("Fan-out call timed out")
+                except Exception as err:  # noqa: BLE001
+                    _LOGGER.debug("Fan-out call failed: %s", str(err))
+                return None
+
+        return await asyncio.gather(*(run(call) for call in calls))
 
     async def connect(self):
         """Connect to player and get authentication cookie.
 
+        Returns as soon as the player answers, the device is warmed up in the
+        background (see init_progress).
+
         Returns:
             json
                 raw api response if successful.
@@ -368,25 +1197,59 @@ class ZidooRC:
         # url = "ZidooControlCenter/connect?name={}&uuid={}&tag=0".format(client_name, client_uuid)
         # response = await self._req_json(url, log_errors=False)
 
+        if not await self.probe():
+            return None
+        # the port answered, close an open breaker instead of waiting out its cooldown
+        self._breaker.record_success()
         response = await self.get_system_info(log_errors=False)
 
         if response and response.get("status") == 200:
             _LOGGER.debug("connected: %s", response)
+            self._audio_output_expires = 0.0
             if self._mac is None:
                 self._mac = response.get("net_mac")
             self._power_status = True
 
-            await self._init_device()
+            self._start_init()
             return response
         return None
 
     async def disconnect(self) -> None:
         """Async Close connection."""
+        task = self._cancel_init()
+        if task is not None:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
         if self._session:
             await self._session.close()
         self._psk = None
         self._session = None
 
+    @property
+    def endpoint_stats(self) -> dict:
+        """Request counters and latency histograms per endpoint."""
+        return self._metrics.stats()
+
+    @property
+    def media_cache(self) -> ZidooMediaCache:
+        """Video metadata cache by file path."""
+        return self._media_cache
+
+    @property
+    def breaker_state(self) -> str:
+        """Circuit breaker state (see ZBREAKER states)."""
+        return self._breaker.state
+
+    @property
+    def retry_policy(self) -> ZidooRetryPolicy:
+        """Request timeout and retry policy."""
+        return self._retry_policy
+
+    @property
+    def connection_stats(self) -> dict:
+        """Pooled connection counters (new handshakes vs reused connections)."""
+        return dict(self._connection_stats)
+
     def is_connected(self) -> bool:
         """Check connection status.
 
@@ -435,13 +1298,34 @@ class ZidooRC:
             return True
         return False
 
+    async def _single_flight(self, key: tuple, request):
+        """Async Share one in-flight request between identical concurrent calls.
+
+        Parameters
+            key: tuple
+                request identity
+            request: callable
+                returns the coroutine to run when no call is in flight
+        Returns
+            shared result of the request
+        """
+        pending = self._inflight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(request())
+            self._inflight[key] = pending
+            pending.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # shield so a cancelled caller does not cancel the other waiters
+        return await asyncio.shield(pending)
+
     async def _req_json(
         self,
         url: str,
         params: dict | None = None,
         log_errors: bool = True,
-        timeout: int = TIMEOUT,
-        max_retries: int = RETRIES,
+        timeout: float | None = None,
+        max_retries: int | None = None,
+        coalesce: bool = False,
+        priority: int = ZPRIORITY_INTERACTIVE,
     ):
         """Async Send request command via HTTP json to player.
 
@@ -453,29 +1337,95 @@ class ZidooRC:
             log_errors: bool
                 suppresses error logging if False
             max_retries
-                reties on response errors
+                reties on response errors (retry policy default if None)
             timeout
-                request timeout in seconds
+                request timeout hint in seconds, used until the retry policy
+                has measured the endpoint latency (policy default if None)
+            coalesce: bool
+                share the response with identical concurrent requests.
+                Only use for idempotent queries whose result is not modified.
+            priority: int
+                request scheduling class (see ZPRIORITY)
         Returns
             json
                 raw API response
         """
+        if coalesce:
+            key = (url, tuple(sorted(params.items())) if params else ())
+            return await self._single_flight(
+                key,
+                lambda: self._req_json(
+                    url, params, log_errors, timeout, max_retries, priority=priority
+                ),
+            )
 
-        while max_retries >= 0:
-            response = await self._send_cmd(url, params, log_errors, timeout)
+        if not await self._breaker_allows():
+            return None
+
+        policy = self._retry_policy
+        endpoint = policy.endpoint(url)
+        latency_key = policy.latency_key(url)
+        if max_retries is None:
+            max_retries = policy.retries
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + policy.get_budget(timeout)
+
+        answered = False
+        attempt = 0
+        while True:
+            async with self._scheduler.slot(priority):
+                request_timeout = max(
+                    min(
+                        policy.get_timeout(latency_key, timeout),
+                        deadline - loop.time(),
+                    ),
+                    TIMEOUT_MIN,
+                )
+                start = loop.time()
+                response = await self._send_cmd(
+                    url, params, log_errors, request_timeout
+                )
+                result = None
+                if response and response.status == 200:
+                    result, size = await self._read_json(response)
+                latency = loop.time() - start
 
+            if response is not None:
+                answered = True
             if response and response.status == 200:
-                result = await response.json(content_type=None)
+                policy.record(latency_key, latency)
+                self._metrics.record(
+                    endpoint, latency, size, result.get("status") if result else None
+                )
                 # _LOGGER.debug("url:%s params:%s result:%s",str(url),str(params),str(result.get("status")))
                 if result:
                     # player can report 804 when switching media. force retry
                     if ZCMD_STATUS not in url or result.get("status") != 804:
+                        self._breaker.record_success()
                         return result
-
-            if max_retries > 0:
-                _LOGGER.warning("[W] Retry %d: url:%s", max_retries, url)
-                await asyncio.sleep(0.5)
-            max_retries -= 1
+            elif latency >= request_timeout:
+                # count timeouts as samples so slow players get longer timeouts
+                policy.record(latency_key, request_timeout)
+                self._metrics.record_error(endpoint, timeout=True)
+            else:
+                self._metrics.record_error(endpoint)
+
+            if attempt >= max_retries:
+                break
+            delay = policy.get_backoff(attempt)
+            if loop.time() + delay + TIMEOUT_MIN > deadline:
+                _LOGGER.debug("Retry budget exhausted: url:%s", url)
+                break
+            attempt += 1
+            self._metrics.record_retry(endpoint)
+            _LOGGER.warning("[W] Retry %d: url:%s", attempt, url)
+            await asyncio.sleep(delay)
+
+        # any http response shows the player is alive
+        if answered:
+            self._breaker.record_success()
+        else:
+            self._breaker.record_failure()
 
         # clear cookies to show not connected
         if self._cookies is not None:
@@ -483,12 +1433,107 @@ class ZidooRC:
             self._cookies = None
         return None
 
+    async def _read_json(self, response) -> tuple:
+        """Async Read and decode a json response.
+
+        Compressed bodies are decompressed here so the transfer savings can be
+        measured.  Large bodies are decoded in an executor to keep the event
+        loop responsive.
+
+        Returns
+            tuple
+                decoded json, bytes received
+        """
+        body = await response.read()
+        encoding = response.headers.get("Content-Encoding", "").lower()
+        if len(body) > JSON_EXECUTOR_SIZE:
+            result, size = await asyncio.get_running_loop().run_in_executor(
+                None, self._decode_json, body, encoding
+            )
+        else:
+            result, size = self._decode_json(body, encoding)
+
+        if encoding and size:
+            _LOGGER.debug(
+                "%s response %s: %d of %d bytes (%d%% saved)",
+                encoding,
+                response.url.path,
+                len(body),
+                size,
+                100 - len(body) * 100 // size,
+            )
+        return result, len(body)
+
+    def _decode_json(self, body: bytes, encoding: str) -> tuple:
+        """Decompress and decode a response body.
+
+        Returns
+            tuple
+                decoded json (None if empty or invalid), decompressed size
+        """
+        try:
+            body = _decompress(body, encoding)
+        except zlib.error as err:
+            _LOGGER.debug("Bad %s response: %s", encoding, str(err))
+            return None, 0
+        if not body.strip():
+            return None, len(body)
+        try:
+            return self._json_loads(body), len(body)
+        except JSON_DECODE_ERRORS as err:
+            _LOGGER.debug("Bad json response: %s", str(err))
+            return None, len(body)
+
+    async def _breaker_allows(self) -> bool:
+        """Async Check the circuit breaker, probing the player when half-open."""
+        breaker = self._breaker
+        if breaker.state == ZBREAKER_CLOSED:
+            return True
+        if not breaker.probe_due():
+            return False
+        if await self.probe():
+            breaker.record_success()
+            return True
+        breaker.record_failure()
+        return False
+
+    async def probe(
+        self, timeout: float = TIMEOUT_PROBE, neighbor: bool = False
+    ) -> bool:
+        """Async Check the api port accepts a TCP connection.
+
+        Parameters
+            timeout: float
+                connection deadline in seconds
+            neighbor: bool
+                first check the neighbor (ARP) table, an unresolved address
+                fails without trying to connect
+        Returns
+            True if the player is reachable
+        """
+        if neighbor:
+            resolved = await asyncio.get_running_loop().run_in_executor(
+                None, _neighbor_resolved, self._ip
+            )
+            if resolved is False:
+                return False
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(self._ip, CONF_PORT), timeout
+            )
+        except (OSError, TimeoutError):
+            return False
+        writer.close()
+        with contextlib.suppress(OSError):
+            await writer.wait_closed()
+        return True
+
     async def _send_cmd(
         self,
         url: str,
         params: dict | None = None,
         log_errors: bool = True,
-        timeout: int = TIMEOUT,
+        timeout: float = TIMEOUT,
     ):
         """Async Send request command via HTTP json to player.
 
@@ -506,9 +1551,8 @@ class ZidooRC:
                 raw API response
         """
         if self._session is None:
-            self._session = ClientSession(
-                cookie_jar=CookieJar(unsafe=True, quote_cookie=False)
-            )
+            pool = self._pool or ZidooConnectionPool.get()
+            self._session = pool.create_session(self._connection_stats)
 
         headers = {}
         if self._psk is not None:
@@ -516,6 +1560,7 @@ class ZidooRC:
 
         headers["Cache-Control"] = "no-cache"
         headers["Connection"] = "keep-alive"
+        headers["Accept-Encoding"] = "gzip"
 
         url = f"http://{self._host}/{url}"
 
@@ -576,24 +1621,23 @@ class ZidooRC:
                 season_name: season title (tv only)
                 series_name: series title (tv only)
         """
+        # a playing video takes precedence, so only skip the music player
+        if self._current_source == ZCONTENT_VIDEO:
+            video = await self._get_video_info()
+            music = None if self._is_playing(video) else await self._get_music_info()
+        else:
+            video, music = await self._probe_playing_info()
+
         return_value = {}
 
-        response = await self._get_video_playing_info()
-        if response is not None:
-            return_value = response
-            return_value["source"] = "video"
+        if video is not None:
+            return_value = video
             if return_value.get("status") is True:
                 self._current_source = ZCONTENT_VIDEO
                 return {**return_value, **self._movie_info}
 
-        if self._audio_output_list:
-            response = await self._get_music_playing_info_v2()
-        else:
-            response = await self._get_music_playing_info()
-
-        if response is not None:
-            return_value = response
-            return_value["source"] = "music"
+        if music is not None:
+            return_value = music
             if return_value["status"]:
                 self._current_source = ZCONTENT_MUSIC
                 return return_value
@@ -603,11 +1647,55 @@ class ZidooRC:
 
         return return_value
 
+    @staticmethod
+    def _is_playing(info: dict | None) -> bool:
+        """Check if playing info shows active playback (video or music)."""
+        return info is not None and info.get("status") in (True, ZSTATE_PLAYING)
+
+    async def _probe_playing_info(self) -> tuple:
+        """Async Query both players concurrently, stopping at a playing video.
+
+        Returns
+            tuple
+                video info, music info (None if not available or not needed)
+        """
+        video = asyncio.ensure_future(self._get_video_info())
+        music = asyncio.ensure_future(self._get_music_info())
+        try:
+            video_info = await video
+            if self._is_playing(video_info):
+                return video_info, None
+            return video_info, await music
+        finally:
+            for task in (video, music):
+                task.cancel()
+
+    async def _get_video_info(self):
+        """Async Get video player information tagged with its source."""
+        response = await self._get_video_playing_info()
+        if response is not None:
+            response["source"] = "video"
+        return response
+
+    async def _get_music_info(self):
+        """Async Get music player information tagged with its source."""
+        if self._audio_output_list:
+            response = await self._get_music_playing_info_v2()
+        else:
+            response = await self._get_music_playing_info()
+        if response is not None:
+            response["source"] = "music"
+        return response
+
     async def _get_video_playing_info(self):
         """Async Get information from built in video player."""
         return_value = {}
         response = await self._req_json(
-            f"ZidooVideoPlay/{ZCMD_STATUS}", log_errors=False, timeout=TIMEOUT_INFO
+            f"ZidooVideoPlay/{ZCMD_STATUS}",
+            log_errors=False,
+            timeout=TIMEOUT_INFO,
+            coalesce=True,
+            priority=ZPRIORITY_STATUS,
         )
 
         if response is not None and response.get("status") == 200:
@@ -636,13 +1724,19 @@ class ZidooRC:
                 return_value["bitrate"] = result.get("bitrate")
                 return_value["audio"] = result.get("audioInfo")
                 return_value["video"] = result.get("output")
+                if return_value["uri"] != self._track_path:
+                    # another file, drop its track lists before the id lookup
+                    self._track_path = return_value["uri"]
+                    self._track_lists = {}
                 if (
                     return_value["status"] is True
                     and return_value["uri"]
                     and return_value["uri"] != self._last_video_path
                 ):
+                    # the path is stored once the lookup completes, so a lookup
+                    # cancelled by _probe_playing_info is retried by the next poll
+                    self._video_id = await self._get_id_from_uri(return_value["uri"])
                     self._last_video_path = return_value["uri"]
-                    self._video_id = await self._get_id_from_uri(self._last_video_path)
                 return_value["id"] = self._video_id
                 return return_value
         # _LOGGER.debug("video play info: %s", str(response))
@@ -650,11 +1744,18 @@ class ZidooRC:
 
     async def _get_id_from_uri(self, uri: str) -> int:
         """Async Return movie id from the path."""
+        cached = self._media_cache.get(uri)
+        if cached is not None:
+            movie_id, self._movie_info = cached
+            _LOGGER.debug("cached media detected (%s)", str(movie_id))
+            return movie_id
+
         movie_id = 0
         movie_info = {}
 
         response = await self._req_json(
-            f"ZidooPoster/v2/getAggregationOfFile?path={urllib.parse.quote(uri)}"
+            f"ZidooPoster/v2/getAggregationOfFile?path={urllib.parse.quote(uri)}",
+            priority=ZPRIORITY_STATUS,
         )
 
         if response:
@@ -692,6 +1793,7 @@ class ZidooRC:
                     movie_id = result.get("parentId")
 
             self._movie_info = movie_info
+            self._media_cache.put(uri, movie_id, movie_info)
 
         _LOGGER.debug("new media detected (%s): %s", str(movie_id), str(movie_info))
         return movie_id
@@ -700,7 +1802,11 @@ class ZidooRC:
         """Async Get information from built in Music Player."""
         return_value = {}
         response = await self._req_json(
-            f"ZidooMusicControl/{ZCMD_STATUS}", log_errors=False, timeout=TIMEOUT_INFO
+            f"ZidooMusicControl/{ZCMD_STATUS}",
+            log_errors=False,
+            timeout=TIMEOUT_INFO,
+            coalesce=True,
+            priority=ZPRIORITY_STATUS,
         )
 
         if response is not None and response.get("status") == 200:
@@ -743,7 +1849,11 @@ class ZidooRC:
         """Async Get Eversolo information from built in Music Player using API V2."""
         return_value = {}
         response = await self._req_json(
-            "ZidooMusicControl/v2/getState", log_errors=False, timeout=TIMEOUT_INFO
+            "ZidooMusicControl/v2/getState",
+            log_errors=False,
+            timeout=TIMEOUT_INFO,
+            coalesce=True,
+            priority=ZPRIORITY_STATUS,
         )
 
         return_value["status"] = ZSTATE_STOPPED
@@ -841,12 +1951,23 @@ class ZidooRC:
                 return next(temp, 0)
         return 0
 
-    async def get_subtitle_list(self, log_errors=True) -> dict:
+    def _cache_track_list(self, name: str, values: dict) -> dict:
+        """Cache a track list of the playing file until the media changes."""
+        if values and self._track_path:
+            self._track_lists[name] = values
+        return values
+
+    async def get_subtitle_list(self, log_errors=True, cached: bool = True) -> dict:
         """Async Get subtitle list.
 
+        Parameters
+            cached: bool
+                use the list cached for the playing file
         Returns:
             dictionary list
         """
+        if cached and "subtitle" in self._track_lists:
+            return self._track_lists["subtitle"]
         return_values = {}
         response = await self._req_json(
             "ZidooVideoPlay/getSubtitleList", log_errors=log_errors
@@ -857,7 +1978,7 @@ class ZidooRC:
                 index = result.get("index")
                 return_values[index] = result.get("title")
 
-        return return_values
+        return self._cache_track_list("subtitle", return_values)
 
     async def set_subtitle(self, index: int | None = None) -> bool:
         """Async Select subtitle.
@@ -882,13 +2003,18 @@ class ZidooRC:
             return True
         return False
 
-    async def get_audio_list(self) -> dict:
+    async def get_audio_list(self, cached: bool = True) -> dict:
         """Async Get audio track list.
 
+        Parameters
+            cached: bool
+                use the list cached for the playing file
         Returns:
             dictionary
                 list of audio tracks
         """
+        if cached and "audio" in self._track_lists:
+            return self._track_lists["audio"]
         return_values = {}
         response = await self._req_json("ZidooVideoPlay/getAudioList")
 
@@ -897,7 +2023,7 @@ class ZidooRC:
                 index = result.get("index")
                 return_values[index] = result.get("title")
 
-        return return_values
+        return self._cache_track_list("audio", return_values)
 
     async def set_audio(self, index: int | None = None) -> bool:
         """Async Select audio track.
@@ -920,13 +2046,18 @@ class ZidooRC:
             return True
         return False
 
-    async def get_zoom_list(self) -> dict:
+    async def get_zoom_list(self, cached: bool = True) -> dict:
         """Async get video zoom list.
 
+        Parameters
+            cached: bool
+                use the list cached for the playing file
         Returns:
             dictionary
                 list of zoom types
         """
+        if cached and "zoom" in self._track_lists:
+            return self._track_lists["zoom"]
         return_values = {}
         response = await self._req_json("VideoPlay/getZoomList")
 
@@ -935,7 +2066,7 @@ class ZidooRC:
                 index = result.get("index")
                 return_values[index] = result.get("title")
 
-        return return_values
+        return self._cache_track_list("zoom", return_values)
 
     async def set_zoom(self, index: str | int | None = None) -> bool:
         """Async select video zoom.
@@ -946,14 +2077,13 @@ class ZidooRC:
         Return
             True if successful
         """
-        zoom_list = await self.get_zoom_list()
         if isinstance(index, str):
-            index_list = list(zoom_list.values())
+            index_list = list((await self.get_zoom_list()).values())
             index = (
                 index_list.index(index) if index in index_list else self._current_zoom
             )
         if index is None:
-            index = self._next_data(zoom_list, self._current_zoom)
+            index = self._next_data(await self.get_zoom_list(), self._current_zoom)
 
         response = await self._req_json(
             f"VideoPlay/setZoom?index={index}", log_errors=False
@@ -986,7 +2116,11 @@ class ZidooRC:
                 'pyapiversion': python api version
         """
         response = await self._req_json(
-            "ZidooControlCenter/getModel", log_errors=log_errors, max_retries=0
+            "ZidooControlCenter/getModel",
+            log_errors=log_errors,
+            max_retries=0,
+            coalesce=True,
+            priority=ZPRIORITY_STATUS,
         )
 
         if response and response.get("status") == 200:
@@ -994,14 +2128,19 @@ class ZidooRC:
             return response
         return None
 
-    async def get_power_status(self) -> str:
+    async def get_power_status(self, neighbor: bool = False) -> str:
         """Async Get power status.
 
+        Parameters
+            neighbor: bool
+                also check the neighbor (ARP) table before connecting
         Returns:
             "on" when player is on
             "off" when player is not available
         """
         self._power_status = False
+        if not await self.probe(neighbor=neighbor):
+            return "off"
         try:
             response = await self.get_system_info()
 
@@ -1029,13 +2168,23 @@ class ZidooRC:
     # f"/ZidooMusicControl/v2/setDevicesVolume?volume={device_volume}"
     #    return 0
 
-    async def get_audio_output(self) -> int:
-        """Async Return last known audio output using API V2."""
+    async def get_audio_output(self, cached: bool = True) -> int:
+        """Async Return last known audio output using API V2.
+
+        Parameters
+            cached: bool
+                use the cached output list and index while not expired
+        """
+        loop_time = asyncio.get_running_loop().time()
+        if cached and loop_time < self._audio_output_expires:
+            return self._audio_output_index
 
         response = await self._req_json(
             "ZidooMusicControl/v2/getInputAndOutputList",
             log_errors=False,
             timeout=TIMEOUT_INFO,
+            coalesce=True,
+            priority=ZPRIORITY_STATUS,
         )
 
         if response is not None and response.get("status") == 200:
@@ -1046,9 +2195,11 @@ class ZidooRC:
                     name = result.get("name")
                     output_list[name] = result.get("tag")
             self._audio_output_list = output_list
+            self._audio_output_index = response.get("outputIndex")
+            self._audio_output_expires = loop_time + self._audio_output_ttl
 
             # return the index
-            return response.get("outputIndex")
+            return self._audio_output_index
 
         # for debugging
         # output_list = {}
@@ -1068,6 +2219,7 @@ class ZidooRC:
         response = await self._req_json(
             f"ZidooMusicControl/v2/setOutInputList?tag={output_tag}"
         )
+        self._audio_output_expires = 0.0
 
         if response is not None and response.get("status") == 200:
             return True
@@ -1083,7 +2235,10 @@ class ZidooRC:
         return_values = {}
 
         response = await self._req_json(
-            "ZidooControlCenter/Apps/getApps", log_errors=log_errors
+            "ZidooControlCenter/Apps/getApps",
+            log_errors=log_errors,
+            coalesce=True,
+            priority=ZPRIORITY_BACKGROUND,
         )
 
         if response is not None and response.get("status") == 200:
@@ -1130,14 +2285,16 @@ class ZidooRC:
                 'path': device path
                 'type': device type (see ZDEVICE_TYPE)
         """
-        response = await self._req_json("ZidooFileControl/getDevices")
+        response = await self._req_json(
+            "ZidooFileControl/getDevices", coalesce=True, priority=ZPRIORITY_BACKGROUND
+        )
 
         if response is not None and response.get("status") == 200:
             return response["devices"]
         return None
 
     async def get_movie_list(
-        self, filter_type: int = -1, max_count: int = DEFAULT_COUNT
+        self, filter_type: int = -1, max_count: int = DEFAULT_COUNT, start: int = 0
     ):
         """Async Return list of movies.
 
@@ -1146,6 +2303,8 @@ class ZidooRC:
                 maximum number of list items
             filter_type: int or str
                 see ZVIDEO_FILTER_TYPE
+            start: int
+                index of the first list item
         Returns
             json
                 raw API response if successful
@@ -1160,7 +2319,9 @@ class ZidooRC:
         # v1 ZidooPoster/getVideoList?page=1&pagesize={}&type={}
         # v2 ZidooPoster/v2/getFilterAggregations?type=2&source=-1&videoType=-1&genre=-1&area=-1&year=&sort=0&start=0&count=100
         response = await self._req_json(
-            f"ZidooPoster/v2/getAggregations?start=0&count={max_count}&type={filter_type}"
+            f"ZidooPoster/v2/getAggregations?start={start}&count={max_count}&type={filter_type}",
+            coalesce=True,
+            priority=ZPRIORITY_BACKGROUND,
         )
 
         # if response is not None:  # and response.get("status") == 200:
@@ -1168,6 +2329,72 @@ class ZidooRC:
         #        response["array"].sort(key=byId, reverse=True)
         return response
 
+    async def get_library_fingerprint(
+        self, parts: list[str] | None = None
+    ) -> dict | None:
+        """Async Return cheap markers of the library contents.
+
+        Single item pages of each requested library list are requested
+        concurrently.
+        Each marker pairs the id of the first item with the item count the
+        player reports, so additions and removals anywhere in a list change
+        it (only the first id is compared if the player reports no count).
+
+        Parameters
+            parts: list
+                parts to fingerprint (video, music, album, artist, playlist),
+                None for all
+        Returns
+            dict
+                video: [most recently added id, movie library size]
+                music, album, artist: [first list item id, list size]
+                playlist: marker of the music of each playlist by id (str)
+            Parts the player did not answer are left out, None if none answered.
+        """
+        calls = {
+            "video": functools.partial(self.get_movie_list, "recent", 1),
+            "video_all": functools.partial(self.get_movie_list, "all", 1),
+            "music": functools.partial(self._get_song_list, 1),
+            "album": functools.partial(self._get_album_list, None, 1),
+            "artist": functools.partial(self._get_artist_list, None, 1),
+            "playlist": self._get_playlist_list,
+        }
+        if parts is not None:
+            calls = {
+                part: call
+                for part, call in calls.items()
+                if part in parts or (part == "video_all" and "video" in parts)
+            }
+        results = await self._gather(list(calls.values()))
+        fingerprint = {}
+        for part, response in zip(calls, results, strict=True):
+            if response is None:
+                continue
+            if isinstance(response, list):  # playlist list
+                fingerprint[part] = [item.get("id") for item in response]
+                continue
+            fingerprint[part] = _list_marker(response)
+        video_all = fingerprint.pop("video_all", None)
+        if "video" in fingerprint:
+            if video_all is None:
+                del fingerprint["video"]
+            else:
+                fingerprint["video"][1] = video_all[1]
+        playlists = fingerprint.pop("playlist", None)
+        if playlists is not None:
+            responses = await self._gather(
+                [
+                    functools.partial(self._get_playlist_list, playlist_id, 1)
+                    for playlist_id in playlists
+                ]
+            )
+            if all(response is not None for response in responses):
+                fingerprint["playlist"] = {
+                    str(playlist_id): _list_marker(response)
+                    for playlist_id, response in zip(playlists, responses, strict=True)
+                }
+        return fingerprint or None
+
     async def get_collection_list(self, movie_id: int | str):
         """Async Return video collection details.
 
@@ -1180,7 +2407,9 @@ class ZidooRC:
         """
         # v1 ZidooPoster/getCollection?id={}
         # v2 ZidooPoster/v2/getCollection?id={}
-        response = await self._req_json(f"ZidooPoster/getCollection?id={movie_id}")
+        response = await self._req_json(
+            f"ZidooPoster/getCollection?id={movie_id}", priority=ZPRIORITY_BACKGROUND
+        )
 
         if response is not None:  # and response.get("status") == 200:
             return response
@@ -1198,7 +2427,9 @@ class ZidooRC:
         """
         # v1 ZidooPoster/getDetail?id={}
         # v2 ZidooPoster/v2/getDetail?id={}
-        response = await self._req_json(f"ZidooPoster/v2/getDetail?id={movie_id}")
+        response = await self._req_json(
+            f"ZidooPoster/v2/getDetail?id={movie_id}", priority=ZPRIORITY_BACKGROUND
+        )
 
         if response is not None:  # and response.get("status") == 200:
             return response
@@ -1248,46 +2479,75 @@ class ZidooRC:
         music_type: int = 0,
         music_id: int | str | None = None,
         max_count: int = DEFAULT_COUNT,
+        start: int = 0,
     ):
-        """Async Return list of music.
+        """Async Return list of music and queue its songs for play_music.
 
         Parameters
             max_count: int
                 maximum number of list items
             filter_type: int or str
                 see ZVIDEO_FILTER_TYPE
+            start: int
+                index of the first list item (the playlist list is not paged)
+        Returns
+            json
+                raw API response if successful
+        """
+        response = await self.fetch_music_list(music_type, music_id, max_count, start)
+        if response and (
+            music_type
+            not in (ZMEDIA_TYPE_ARTIST, ZMEDIA_TYPE_ALBUM, ZMEDIA_TYPE_PLAYLIST)
+            or (music_type == ZMEDIA_TYPE_PLAYLIST and music_id in ZMEDIA_PLAYLIST)
+        ):
+            self._song_list = self._get_music_ids(response.get("array"))
+        return response
+
+    async def fetch_music_list(
+        self,
+        music_type: int = 0,
+        music_id: int | str | None = None,
+        max_count: int = DEFAULT_COUNT,
+        start: int = 0,
+    ):
+        """Async Return list of music without changing the play_music queue.
+
+        Parameters
+            see get_music_list
         Returns
             json
                 raw API response if successful
         """
         if music_type == ZMEDIA_TYPE_ARTIST:
-            return await self._get_artist_list(music_id, max_count)
+            return await self._get_artist_list(music_id, max_count, start)
         if music_type == ZMEDIA_TYPE_ALBUM:
-            return await self._get_album_list(music_id, max_count)
+            return await self._get_album_list(music_id, max_count, start)
         if music_type == ZMEDIA_TYPE_PLAYLIST:
-            return await self._get_playlist_list(music_id, max_count)
-        return await self._get_song_list(max_count)
+            return await self._get_playlist_list(music_id, max_count, start)
+        return await self._get_song_list(max_count, start)
 
-    async def _get_song_list(self, max_count: int = DEFAULT_COUNT):
+    async def _get_song_list(self, max_count: int = DEFAULT_COUNT, start: int = 0):
         """Async Return list of albums or album music.
 
         Parameters
             max_count: int
                 maximum number of list items
+            start: int
+                index of the first list item
         Returns
             json
                 raw API response if successful
         """
-        response = await self._req_json(
-            f"MusicControl/v2/getSingleMusics?start=0&count={max_count}"
+        return await self._req_json(
+            f"MusicControl/v2/getSingleMusics?start={start}&count={max_count}",
+            priority=ZPRIORITY_BACKGROUND,
         )
-        if response:
-            self._song_list = self._get_music_ids(response.get("array"))
-
-        return response
 
     async def _get_album_list(
-        self, album_id: int | str | None = None, max_count: int = DEFAULT_COUNT
+        self,
+        album_id: int | str | None = None,
+        max_count: int = DEFAULT_COUNT,
+        start: int = 0,
     ):
         """Async Return list of albums or album music.
 
@@ -1296,23 +2556,30 @@ class ZidooRC:
                 see ZVIDEO_FILTER_TYPE
             max_count: int
                 maximum number of list items
+            start: int
+                index of the first list item
         Returns
             json
                 raw API response if successful
         """
         if album_id:
             response = await self._req_json(
-                f"MusicControl/v2/getAlbumMusics?id={album_id}&start=0&count={max_count}"
+                f"MusicControl/v2/getAlbumMusics?id={album_id}&start={start}&count={max_count}",
+                priority=ZPRIORITY_BACKGROUND,
             )
         else:
             response = await self._req_json(
-                f"MusicControl/v2/getAlbums?start=0&count={max_count}"
+                f"MusicControl/v2/getAlbums?start={start}&count={max_count}",
+                priority=ZPRIORITY_BACKGROUND,
             )
 
         return response
 
     async def _get_artist_list(
-        self, artist_id: int | str | None = None, max_count: int = DEFAULT_COUNT
+        self,
+        artist_id: int | str | None = None,
+        max_count: int = DEFAULT_COUNT,
+        start: int = 0,
     ):
         """Async Return list of artists or artist music.
 
@@ -1323,22 +2590,28 @@ class ZidooRC:
                 maximum number of list items
             filter_type: int or str
                 see ZVIDEO_FILTER_TYPE
+            start: int
+                index of the first list item
         Returns
             json
                 raw API response if successful
         """
         if artist_id:
             response = await self._req_json(
-                f"MusicControl/v2/getArtistMusics?id={artist_id}&start=0&count={max_count}"
+                f"MusicControl/v2/getArtistMusics?id={artist_id}&start={start}&count={max_count}",
+                priority=ZPRIORITY_BACKGROUND,
             )
         else:
             response = await self._req_json(
-                f"MusicControl/v2/getArtists?start=0&count={max_count}"
+                f"MusicControl/v2/getArtists?start={start}&count={max_count}",
+                priority=ZPRIORITY_BACKGROUND,
             )
 
         return response
 
-    async def _get_playlist_list(self, playlist_id=None, max_count=DEFAULT_COUNT):
+    async def _get_playlist_list(
+        self, playlist_id=None, max_count=DEFAULT_COUNT, start: int = 0
+    ):
         """Async Return list of playlists.
 
         Parameters
@@ -1346,6 +2619,8 @@ class ZidooRC:
                 maximum number of list items
             filter_type: int or str
                 see ZVIDEO_FILTER_TYPE
+            start: int
+                index of the first list item (playlist music only)
         Returns
             json
                 raw API response if successful
@@ -1353,30 +2628,34 @@ class ZidooRC:
         if playlist_id:
             if playlist_id == ZMEDIA_PLAYLIST[1]:  # playing
                 response = await self._req_json(
-                    f"MusicControl/v2/getPlayQueue?start=0&count={max_count}".format()
+                    f"MusicControl/v2/getPlayQueue?start={start}&count={max_count}".format(),
+                    priority=ZPRIORITY_BACKGROUND,
                 )
-                if response:
-                    self._song_list = self._get_music_ids(response.get("array"))
             elif playlist_id == ZMEDIA_PLAYLIST[0]:  # favorites
                 response = await self._req_json(
-                    f"MusicControl/v2/getFavorites?start=0&count={max_count}".format()
+                    f"MusicControl/v2/getFavorites?start={start}&count={max_count}".format(),
+                    priority=ZPRIORITY_BACKGROUND,
                 )
-                if response:
-                    self._song_list = self._get_music_ids(response.get("array"))
             else:
                 response = await self._req_json(
-                    f"MusicControl/v2/getSongListMusics?id={playlist_id}&start=0&count={max_count}"
+                    f"MusicControl/v2/getSongListMusics?id={playlist_id}&start={start}&count={max_count}",
+                    priority=ZPRIORITY_BACKGROUND,
                 )
         else:
             response = await self._req_json(
                 # "MusicControl/v2/getSongList?start=0&count={}".format(max_count)
-                "MusicControl/v2/getSongLists"
+                "MusicControl/v2/getSongLists",
+                priority=ZPRIORITY_BACKGROUND,
             )
 
         return response
 
     async def search_movies(
-        self, query: str, search_type: int = 0, max_count: int = DEFAULT_COUNT
+        self,
+        query: str,
+        search_type: int = 0,
+        max_count: int = DEFAULT_COUNT,
+        start: int = 0,
     ):
         """Async Return list of video based on query.
 
@@ -1385,6 +2664,8 @@ class ZidooRC:
                 database movie_id
             search_type: int ot str
                 see ZVIDEO_SEARCH_TYPES
+            start: int
+                index of the first result
         Returns
             json
                 raw API response (no status)
@@ -1394,8 +2675,9 @@ class ZidooRC:
 
         # v1 "ZidooPoster/search?q={}&type={}&page=1&pagesize={}".format(query, filter_type, max_count)
         response = await self._req_json(
-            f"ZidooPoster/v2/searchAggregation?q={query}&type={search_type}&start=0&count={max_count}",
+            f"ZidooPoster/v2/searchAggregation?q={query}&type={search_type}&start={start}&count={max_count}",
             timeout=TIMEOUT_SEARCH,
+            priority=ZPRIORITY_BACKGROUND,
         )
 
         if response is not None and response.get("status") == 200:
@@ -1408,6 +2690,7 @@ class ZidooRC:
         search_type: int = 0,
         max_count: int = DEFAULT_COUNT,
         play: bool = False,
+        start: int = 0,
     ):
         """Async Return list of music based on query.
 
@@ -1420,6 +2703,8 @@ class ZidooRC:
                 max number of songs returned
             play: bool
                 automatically plays content.  search_type=0 only
+            start: int
+                index of the first result
         Returns
             json
                 raw API response (no status)
@@ -1428,17 +2713,19 @@ class ZidooRC:
             search_type = ZMUSIC_SEARCH_TYPES[search_type]
 
         if search_type == 1:
-            return await self._search_album(query, max_count)
+            return await self._search_album(query, max_count, start)
         if search_type == 2:
-            return await self._search_artist(query, max_count)
-        response = await self._search_song(query, max_count)
+            return await self._search_artist(query, max_count, start)
+        response = await self._search_song(query, max_count, start)
         if response:
             self._song_list = self._get_music_ids(response.get("array"), sub="result")
             if play and self._song_list:
                 await self.play_music(media_type="music", music_id=self._song_list[0])
         return response
 
-    async def _search_song(self, query: str, max_count: int = DEFAULT_COUNT):
+    async def _search_song(
+        self, query: str, max_count: int = DEFAULT_COUNT, start: int = 0
+    ):
         """Async Search by song title.
 
         Parameters
@@ -1449,11 +2736,14 @@ class ZidooRC:
                 raw API response (no status)
         """
         return await self._req_json(
-            f"MusicControl/v2/searchMusic?key={query}&start=0&count={max_count}",
+            f"MusicControl/v2/searchMusic?key={query}&start={start}&count={max_count}",
             timeout=TIMEOUT_SEARCH,
+            priority=ZPRIORITY_BACKGROUND,
         )
 
-    async def _search_album(self, query: str, max_count: int = DEFAULT_COUNT):
+    async def _search_album(
+        self, query: str, max_count: int = DEFAULT_COUNT, start: int = 0
+    ):
         """Async Search by album name.
 
         Parameters
@@ -1464,11 +2754,14 @@ class ZidooRC:
                 raw API response (no status)
         """
         return await self._req_json(
-            f"MusicControl/v2/searchAlbum?key={query}&start=0&count={max_count}",
+            f"MusicControl/v2/searchAlbum?key={query}&start={start}&count={max_count}",
             timeout=TIMEOUT_SEARCH,
+            priority=ZPRIORITY_BACKGROUND,
         )
 
-    async def _search_artist(self, query: str, max_count: int = DEFAULT_COUNT):
+    async def _search_artist(
+        self, query: str, max_count: int = DEFAULT_COUNT, start: int = 0
+    ):
         """Async Search by artist name.
 
         Parameters
@@ -1479,10 +2772,270 @@ class ZidooRC:
                 raw API response (no status)
         """
         return await self._req_json(
-            f"MusicControl/v2/searchArtist?key={query}&start=0&count={max_count}",
+            f"MusicControl/v2/searchArtist?key={query}&start={start}&count={max_count}",
             timeout=TIMEOUT_SEARCH,
+            priority=ZPRIORITY_BACKGROUND,
         )
 
+    async def _iter_pages(
+        self, fetch, page_size: int = PAGE_SIZE
+    ) -> AsyncIterator[dict]:
+        """Async Stream list items page by page.
+
+        The next page is requested while the current page is consumed, and
+        the page size adapts so each page takes about PAGE_LATENCY seconds.
+
+        Parameters
+            fetch:
+                function returning the coroutine of a page (start, count),
+                an empty list past the last page and None on failure
+            page_size: int
+                first page size
+        Returns
+            list items, stopping at the last page
+        Raises
+            ZidooListError
+                when a page fails, so callers can tell it from the end
+        """
+        loop = asyncio.get_running_loop()
+
+        async def load(start: int, count: int):
+            started = loop.time()
+            items = await fetch(start, count)
+            return items, count, loop.time() - started
+
+        start = 0
+        task = loop.create_task(load(start, page_size))
+        try:
+            while task is not None:
+                items, count, latency = await task
+                task = None
+                if items is None:
+                    raise ZidooListError(f"page at {start} failed")
+                if not items:
+                    return
+                start += len(items)
+                if len(items) >= count:
+                    page_size = min(
+                        max(
+                            int(count * PAGE_LATENCY / max(latency, 0.01)),
+                            count // 2,
+                            PAGE_SIZE_MIN,
+                        ),
+                        count * 2,
+                        PAGE_SIZE_MAX,
+                    )
+                    task = loop.create_task(load(start, page_size))
+                for item in items:
+                    yield item
+        finally:
+            if task is not None:
+                task.cancel()
+
+    async def iter_movies(self, filter_type: int | str = 0) -> AsyncIterator[dict]:
+        """Async Stream the movie list.
+
+        Parameters
+            filter_type: int or str
+                see ZVIDEO_FILTER_TYPE
+        Raises
+            ZidooListError
+                when a page fails
+        """
+
+        async def fetch(start, count):
+            response = await self.get_movie_list(filter_type, count, start)
+            return None if response is None else _list_items(response) or []
+
+        async for item in self._iter_pages(fetch):
+            yield item
+
+    async def iter_music(
+        self, music_type: int | str = 0, music_id: int | str | None = None
+    ) -> AsyncIterator[dict]:
+        """Async Stream a music list.
+
+        Parameters
+            music_type: int or str
+                see ZMUSIC_SEARCH_TYPES
+            music_id: int or str
+                album, artist or playlist id for its music
+        Raises
+            ZidooListError
+                when a page fails
+        """
+
+        async def fetch(start, count):
+            response = await self.fetch_music_list(music_type, music_id, count, start)
+            if isinstance(response, list):  # playlist list (not paged)
+                return response if start == 0 else []
+            return None if response is None else _list_items(response) or []
+
+        async for item in self._iter_pages(fetch):
+            yield item
+
+    async def iter_search_movies(
+        self, query: str, search_type: int | str = 0
+    ) -> AsyncIterator[dict]:
+        """Async Stream video search results.
+
+        Parameters
+            query: str
+                text to search
+            search_type: int or str
+                see ZVIDEO_SEARCH_TYPES
+        Raises
+            ZidooListError
+                when a page fails
+        """
+
+        async def fetch(start, count):
+            response = await self.search_movies(query, search_type, count, start)
+            if response is None:
+                return None
+            for key in ("all", "tvs", "movies", "collections"):
+                if response.get(key):
+                    return [item.get("aggregation", item) for item in response[key]]
+            return []
+
+        async for item in self._iter_pages(fetch):
+            yield item
+
+    async def iter_search_music(
+        self, query: str, search_type: int | str = 0
+    ) -> AsyncIterator[dict]:
+        """Async Stream music search results.
+
+        Parameters
+            query: str
+                text to search
+            search_type: int or str
+                see ZMUSIC_SEARCH_TYPES
+        Raises
+            ZidooListError
+                when a page fails
+        """
+        if search_type in ZMUSIC_SEARCH_TYPES:
+            search_type = ZMUSIC_SEARCH_TYPES[search_type]
+        search = {1: self._search_album, 2: self._search_artist}.get(
+            search_type, self._search_song
+        )
+
+        async def fetch(start, count):
+            response = await search(query, count, start)
+            if response is None:
+                return None
+            return [item.get("result") or item for item in _list_items(response) or []]
+
+        async for item in self._iter_pages(fetch):
+            yield item
+
+    async def _search_source(
+        self, query: str, source: str, max_count: int = DEFAULT_COUNT
+    ) -> list:
+        """Async Return the result items of a unified search source."""
+        if source == "video":
+            response = await self.search_movies(query, 0, max_count) or {}
+            return [
+                item.get("aggregation", item)
+                for key in ("all", "movies", "tvs", "collections")
+                for item in response.get(key) or []
+            ]
+        search = {
+            "music": self._search_song,
+            "album": self._search_album,
+            "artist": self._search_artist,
+        }[source]
+        response = await search(query, max_count)
+        return [item.get("result") or item for item in _list_items(response) or []]
+
+    async def iter_search(
+        self,
+        query: str,
+        sources: list[str] | None = None,
+        timeout: float = TIMEOUT_SEARCH,
+        max_count: int = DEFAULT_COUNT,
+    ) -> AsyncIterator[tuple[str, list]]:
+        """Async Search several sources concurrently, streaming each answer.
+
+        Parameters
+            query: str
+                text to search
+            sources: list
+                see ZSEARCH_SOURCES (default all)
+            timeout: float
+                deadline for all sources in seconds
+            max_count: int
+                maximum results per source
+        Returns
+            (source, items) as each source answers, without duplicates.
+            Sources failing or not answering by the deadline are skipped.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        tasks = {
+            loop.create_task(self._search_source(query, source, max_count)): source
+            for source in sources or ZSEARCH_SOURCES
+        }
+        pending = set(tasks)
+        seen = set()
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=max(deadline - loop.time(), 0),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    _LOGGER.debug(
+                        "Search timed out: %s", [tasks[task] for task in pending]
+                    )
+                    return
+                for task in done:
+                    source = tasks[task]
+                    try:
+                        items = task.result()
+                    except Exception as err:  # noqa: BLE001
+                        _LOGGER.debug("Search of %s failed: %s", source, str(err))
+                        continue
+                    results = []
+                    for item in items:
+                        key = (source, item.get("id"))
+                        if key not in seen:
+                            seen.add(key)
+                            results.append(item)
+                    yield source, results
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def search(
+        self,
+        query: str,
+        sources: list[str] | None = None,
+        timeout: float = TIMEOUT_SEARCH,
+        max_count: int = DEFAULT_COUNT,
+    ) -> list[dict]:
+        """Async Search video and music libraries concurrently.
+
+        Parameters
+            query: str
+                text to search
+            sources: list
+                see ZSEARCH_SOURCES (default all)
+            timeout: float
+                deadline for all sources in seconds
+            max_count: int
+                maximum results per source
+        Returns
+            list
+                {"source": source, "item": item} ranked by name match
+        """
+        results = []
+        async for source, items in self.iter_search(query, sources, timeout, max_count):
+            results.extend({"source": source, "item": item} for item in items)
+        return rank_search_results(query, results)
+
     async def play_file(self, uri: str) -> bool:
         """Async Play content by URI.
 
@@ -1574,6 +3127,13 @@ class ZidooRC:
             return True
         return False
 
+    def set_song_list(self, data) -> None:
+        """Set the songs queued by play_music from a music list.
+
+        Long lists are sent to the player as a window from the played song.
+        """
+        self._song_list = self._get_music_ids(data)
+
     def _get_music_ids(self, data, key="id", sub=None):
         ids = []
         if data:
@@ -1608,8 +3168,12 @@ class ZidooRC:
                 f"MusicControl/v2/playMusic?type={ZMUSIC_PLAYLISTTYPE[media_type]}&id={media_id}&musicId={music_id}&music_type=0&trackIndex=1&sort=0"
             )
         else:  # last playlist
+            ids = self._song_list
+            if len(ids) > SONG_QUEUE_LIMIT:  # window a long list to keep the url short
+                index = ids.index(str(music_id)) if str(music_id) in ids else 0
+                ids = ids[index : index + SONG_QUEUE_LIMIT]
             response = await self._req_json(
-                f"MusicControl/v2/playMusics?ids={'%2C'.join(self._song_list)}&musicId={music_id}&trackIndex=-1"
+                f"MusicControl/v2/playMusics?ids={'%2C'.join(ids)}&musicId={music_id}&trackIndex=-1"
             )
 
         if response and response.get("status") == 200:
@@ -1627,7 +3191,9 @@ class ZidooRC:
                     'title': video name (file name)
                     'index': int
         """
-        response = await self._req_json("VideoPlay/getPlaylist")
+        response = await self._req_json(
+            "VideoPlay/getPlaylist", priority=ZPRIORITY_BACKGROUND
+        )
 
         if response and response.get("status") == 200:
             return response
@@ -1643,7 +3209,8 @@ class ZidooRC:
             raw api response if successful
         """
         return await self._req_json(
-            f"MusicControl/v2/getPlayQueue?start=0&count={max_count}"
+            f"MusicControl/v2/getPlayQueue?start=0&count={max_count}",
+            priority=ZPRIORITY_BACKGROUND,
         )
 
     async def get_file_list(self, uri: str, file_type: int = 0):
@@ -1664,7 +3231,8 @@ class ZidooRC:
                     'modifyDate': linux date code
         """
         response = await self._req_json(
-            f"ZidooFileControl/getFileList?path={uri}&type={file_type}"
+            f"ZidooFileControl/getFileList?path={uri}&type={file_type}",
+            priority=ZPRIORITY_BACKGROUND,
         )
 
         if response is not None and response.get("status") == 200:
@@ -1687,7 +3255,8 @@ class ZidooRC:
                     'modifyDate': linux date code
         """
         response = await self._req_json(
-            f"ZidooFileControl/getHost?path={uri}&type={host_type}"
+            f"ZidooFileControl/getHost?path={uri}&type={host_type}",
+            priority=ZPRIORITY_BACKGROUND,
         )
         _LOGGER.debug("zidoo host list: %s", str(response))
 
@@ -1696,8 +3265,15 @@ class ZidooRC:
         if response is not None and response.get("status") == 200:
             return_value["status"] = 200
             hosts = response["hosts"]
-            for item in hosts:
-                response = await self.get_file_list(item.get("ip"), item.get("type"))
+            responses = await self._gather(
+                [
+                    functools.partial(
+                        self.get_file_list, item.get("ip"), item.get("type")
+                    )
+                    for item in hosts
+                ]
+            )
+            for item, response in zip(hosts, responses, strict=True):
                 hostname = item.get("name").split("/")[-1]
                 if response is not None and response.get("status") == 200:
                     for share in response["filelist"]:
@@ -1805,6 +3381,7 @@ class ZidooRC:
         """Async Turn the media player on."""
         # Try using the power on command incase the WOL doesn't work
         self._wakeonlan()
+        self._breaker.reset()
         return await self._send_key(ZKEY_POWER_ON, False)
 
     async def turn_off(self, standby=False):
@@ -1821,7 +3398,7 @@ class ZidooRC:
 
     async def mute_volume(self):
         """Async Send mute command."""
-        return self._send_key(ZKEY_MUTE)
+        return await self._send_key(ZKEY_MUTE)
 
     async def media_play(self):
         """Async Send play command."""
@@ -1852,7 +3429,7 @@ class ZidooRC:
         """Async Send the previous track command."""
         if self._current_source == ZCONTENT_MUSIC:
             return await self._req_json("MusicControl/v2/playLast")
-        return self._send_key(ZKEY_MEDIA_PREVIOUS)
+        return await self._send_key(ZKEY_MEDIA_PREVIOUS)
 
     async def set_media_position(self, position):
         """Async Set the current playing position.
@@ -0,0 +1,58 @@
+"""Tests for the Zidoo coordinator helpers."""
+
+import pytest
+
+from custom_components.zidoo import coordinator
+from custom_components.zidoo.coordinator import PlaybackClock
+
+
+@pytest.fixture
+def now(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Return a manual monotonic clock."""
+    now = [0.0]
+    monkeypatch.setattr(coordinator, "monotonic", lambda: now[0])
+    return now
+
+
+def test_clock_extrapolates(now: list[float]) -> None:
+    """Test the position advances at the playback rate."""
+    clock = PlaybackClock()
+    assert clock.expected is None
+
+    clock.anchor(1000, 1.0)
+    now[0] = 2.5
+    assert clock.expected == 3500
+
+    clock.adjust(rate=0.0)
+    now[0] = 10
+    assert clock.expected == 3500
+    assert clock.rate == 0.0
+
+
+def test_clock_keeps_anchor_within_drift(now: list[float]) -> None:
+    """Test samples close to the expected position do not re-anchor."""
+    clock = PlaybackClock(drift=2000)
+    media = ("video", "/movie.mkv", 1)
+    assert clock.update(1000, 1.0, media)
+    updated_at = clock.updated_at
+
+    now[0] = 10
+    assert not clock.update(12500, 1.0, media)
+    assert clock.position == 1000
+    assert clock.updated_at is updated_at
+
+    assert clock.update(60000, 1.0, media)
+    assert clock.position == 60000
+
+
+def test_clock_reanchors_on_change(now: list[float]) -> None:
+    """Test play/pause, media changes and lost positions re-anchor."""
+    clock = PlaybackClock()
+    media = ("video", "/movie.mkv", 1)
+    clock.update(1000, 1.0, media)
+    assert clock.update(1000, 0.0, media)
+    assert clock.update(1000, 0.0, ("video", "/next.mkv", 2))
+    assert clock.update(None, 0.0, ("video", "/next.mkv", 2))
+    assert clock.position is None
+    assert clock.updated_at is None
+    assert not clock.update(None, 0.0, ("video", "/next.mkv", 2))
@@ -0,0 +1,60 @@
+"""Tests for the Zidoo library mirror."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.zidoo.library import ZidooVideoLibrary
+from homeassistant.core import HomeAssistant
+
+
+def movie(movie_id: int) -> dict:
+    """Return a getAggregations item."""
+    return {"id": movie_id, "name": f"Movie {movie_id}"}
+
+
+@pytest.fixture
+def library(hass: HomeAssistant) -> ZidooVideoLibrary:
+    """Return a video library mirror with a mocked store."""
+    library = ZidooVideoLibrary(hass, MagicMock(), "entry", views=["favorite"])
+    library._store = MagicMock()
+    return library
+
+
+async def test_update_merges_views(library: ZidooVideoLibrary) -> None:
+    """Test fetched views replace mirrored views and keep the others."""
+    assert library._update(
+        {
+            "all": [movie(1), movie(2)],
+            "recent": [movie(2), movie(1)],
+            "favorite": [movie(1)],
+        },
+        True,
+    )
+    assert library.synced
+    assert library.view("favorite") == {"array": [movie(1)]}
+    library._store.async_delay_save.assert_called_once()
+
+    assert library._update({"recent": [movie(3), movie(2), movie(1)]}, False)
+    assert library.views == {"all": [1, 2], "recent": [3, 2, 1], "favorite": [1]}
+    assert library.items.keys() == {1, 2, 3}
+
+    assert not library._update({"favorite": [movie(1)]}, False)
+
+
+async def test_update_prunes_on_rebuild(library: ZidooVideoLibrary) -> None:
+    """Test ids no view contains are only dropped when rebuilding."""
+    library._update(
+        {"all": [movie(1), movie(2)], "recent": [movie(2)], "favorite": [movie(2)]},
+        True,
+    )
+    library._update({"favorite": [], "recent": [movie(1)]}, False)
+    assert library.items.keys() == {1, 2}
+
+    library._update({"all": [movie(1)], "recent": [movie(1)], "favorite": []}, True)
+    assert library.items.keys() == {1}
+    assert library.stats() == {
+        "items": 1,
+        "views": {"all": 1, "recent": 1, "favorite": 0},
+    }
+    assert library.view("movie") is None
@@ -0,0 +1,75 @@
+"""Tests for the Zidoo local library search."""
+
+from custom_components.zidoo.search import (
+    ZidooSearchCatalog,
+    ZidooSearchIndex,
+    normalize,
+)
+from custom_components.zidoo.zidooaio import ZTYPE_COLLECTION, ZTYPE_MOVIE
+
+MOVIES = [
+    {"id": 1, "name": "The Matrix", "type": ZTYPE_MOVIE},
+    {"id": 2, "name": "Matrix Reloaded", "type": ZTYPE_MOVIE},
+    {"id": 3, "name": "Matrix", "type": ZTYPE_MOVIE},
+    {"id": 4, "name": "The Matrix Collection", "type": ZTYPE_COLLECTION},
+    {"id": 5, "name": "Amélie", "type": ZTYPE_MOVIE},
+    {"id": 6, "name": "Casablanca", "type": ZTYPE_MOVIE},
+]
+
+
+def ids(items: list[dict]) -> list[int]:
+    """Return the ids of search results."""
+    return [item["id"] for item in items]
+
+
+def test_normalize() -> None:
+    """Test case, accents and punctuation are ignored."""
+    assert normalize("Amélie!") == "amelie"
+    assert normalize("  Spider-Man:  Far from Home ") == "spider man far from home"
+
+
+def test_search_ranking() -> None:
+    """Test leading and exact matches come first, shorter names first."""
+    catalog = ZidooSearchCatalog(MOVIES, ("name",))
+    assert ids(catalog.search("matrix")) == [3, 2, 1, 4]
+    assert ids(catalog.search("MATRIX", limit=2)) == [3, 2]
+    assert ids(catalog.search("amelie")) == [5]
+    assert catalog.search("") == []
+    assert catalog.search("!!") == []
+
+
+def test_search_typos() -> None:
+    """Test names still match with typos, short queries included."""
+    catalog = ZidooSearchCatalog(MOVIES, ("name",))
+    assert 6 in ids(catalog.search("casablnaca"))
+    assert 3 in ids(catalog.search("matirx"))
+    assert catalog.search("godfather") == []
+
+
+def test_search_types() -> None:
+    """Test results are filtered on item type."""
+    catalog = ZidooSearchCatalog(MOVIES, ("name",))
+    assert ids(catalog.search("matrix", {ZTYPE_COLLECTION})) == [4]
+
+
+def test_search_fields() -> None:
+    """Test all fields of a catalog are searched."""
+    songs = [
+        {"id": 1, "title": "Hey Jude", "artist": "The Beatles"},
+        {"id": 2, "title": "Jude", "artist": "Someone"},
+    ]
+    catalog = ZidooSearchCatalog(songs, ("title", "artist"))
+    assert ids(catalog.search("beatles")) == [1]
+    assert ids(catalog.search("jude")) == [2, 1]
+
+
+def test_search_index() -> None:
+    """Test catalogs that are not indexed return None."""
+    index = ZidooSearchIndex()
+    assert index.search_movies("matrix") is None
+
+    index.update({"video": MOVIES})
+    assert ids(index.search_movies("matrix", "collection")["data"]) == [4]
+    assert len(index.search_movies("matrix")["data"]) == 4
+    assert index.search_music("matrix") is None
+    assert index.stats() == {"video": len(MOVIES)}
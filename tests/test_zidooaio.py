@@ -0,0 +1,228 @@
+"""Tests for the Zidoo api client helpers."""
+
+import asyncio
+
+import pytest
+
+from custom_components.zidoo.zidooaio import (
+    LATENCY_MIN_SAMPLES,
+    TIMEOUT_MIN,
+    ZBREAKER_CLOSED,
+    ZBREAKER_HALF_OPEN,
+    ZBREAKER_OPEN,
+    ZPRIORITY_BACKGROUND,
+    ZPRIORITY_INTERACTIVE,
+    ZPRIORITY_STATUS,
+    ZidooCircuitBreaker,
+    ZidooRequestScheduler,
+    ZidooRetryPolicy,
+)
+
+
+@pytest.mark.parametrize(
+    ("url", "key"),
+    [
+        ("Poster/v2/getAggregations", "Poster/v2/getAggregations"),
+        ("Poster/v2/getAggregations?type=0", "Poster/v2/getAggregations"),
+        ("Poster/v2/getAggregations?start=0&count=1", "Poster/v2/getAggregations#1"),
+        ("Poster/v2/getAggregations?start=0&count=50", "Poster/v2/getAggregations#10"),
+        ("Poster/v2/getAggregations?count=250", "Poster/v2/getAggregations#100"),
+        ("MusicControl/v2/getList?pagesize=500", "MusicControl/v2/getList#100"),
+        ("MusicControl/v2/getList?requestCount=9", "MusicControl/v2/getList#1"),
+    ],
+)
+def test_latency_key(url: str, key: str) -> None:
+    """Test paged requests are keyed by the magnitude of their page size."""
+    assert ZidooRetryPolicy.latency_key(url) == key
+
+
+def test_timeout_from_hint_until_sampled() -> None:
+    """Test the timeout hint is used until enough samples exist."""
+    policy = ZidooRetryPolicy(timeout=5)
+    assert policy.get_timeout("api") == 5
+    for _ in range(LATENCY_MIN_SAMPLES - 1):
+        policy.record("api", 0.2)
+    assert policy.get_timeout("api", 1) == 1
+
+    policy.record("api", 0.2)
+    assert policy.ewma("api") == pytest.approx(0.2)
+    assert policy.p95("api") == pytest.approx(0.2)
+    assert policy.get_timeout("api", 1) == pytest.approx(0.6)
+
+
+def test_timeout_limits() -> None:
+    """Test derived timeouts stay between TIMEOUT_MIN and the hint."""
+    policy = ZidooRetryPolicy(timeout=5)
+    for _ in range(LATENCY_MIN_SAMPLES):
+        policy.record("fast", 0.01)
+        policy.record("slow", 4)
+    assert policy.get_timeout("fast") == TIMEOUT_MIN
+    assert policy.get_timeout("slow") == 5
+    assert policy.get_timeout("slow", 1) == 1
+
+
+def test_latency_per_endpoint() -> None:
+    """Test samples of one endpoint do not change another."""
+    policy = ZidooRetryPolicy()
+    policy.record("Poster/v2/getAggregations#1", 0.1)
+    assert policy.ewma("Poster/v2/getAggregations#1") == pytest.approx(0.1)
+    assert policy.ewma("Poster/v2/getAggregations#100") is None
+    assert set(policy.stats()) == {"Poster/v2/getAggregations#1"}
+
+
+@pytest.mark.parametrize(
+    ("hint", "budget"),
+    [(None, 10), (1, 2), (4, 8), (8, 10), (20, 20)],
+)
+def test_budget(hint: float | None, budget: float) -> None:
+    """Test call budgets scale with the timeout hint but allow one attempt."""
+    policy = ZidooRetryPolicy(budget=10)
+    assert policy.get_budget(hint) == budget
+
+
+def test_backoff() -> None:
+    """Test retry delays double, are jittered and limited."""
+    policy = ZidooRetryPolicy(backoff=0.25, backoff_max=2)
+    for attempt, delay in enumerate((0.25, 0.5, 1, 2, 2, 2)):
+        for _ in range(20):
+            assert delay / 2 <= policy.get_backoff(attempt) <= delay
+
+
+class ManualBreaker(ZidooCircuitBreaker):
+    """Circuit breaker on a manual clock."""
+
+    now = 0.0
+
+    def _now(self) -> float:
+        return self.now
+
+
+def test_breaker_opens_after_threshold() -> None:
+    """Test the circuit opens after consecutive failures only."""
+    breaker = ManualBreaker(threshold=3, cooldown=5)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == ZBREAKER_CLOSED
+    breaker.record_failure()
+    assert breaker.state == ZBREAKER_OPEN
+
+
+def test_breaker_probe_after_cooldown() -> None:
+    """Test an open circuit goes half-open for a probe once cooled down."""
+    breaker = ManualBreaker(threshold=1, cooldown=5)
+    assert not breaker.probe_due()
+    breaker.record_failure()
+    breaker.now = 4.9
+    assert not breaker.probe_due()
+    breaker.now = 5
+    assert breaker.probe_due()
+    assert breaker.state == ZBREAKER_HALF_OPEN
+    assert not breaker.probe_due()
+
+    breaker.record_success()
+    assert breaker.state == ZBREAKER_CLOSED
+
+
+def test_breaker_failed_probe_backs_off() -> None:
+    """Test failed probes double the cooldown up to its limit."""
+    breaker = ManualBreaker(threshold=1, cooldown=5, cooldown_max=12)
+    breaker.record_failure()
+    for cooldown in (5, 10, 12, 12):
+        breaker.now += cooldown - 1
+        assert not breaker.probe_due()
+        breaker.now += 1
+        assert breaker.probe_due()
+        breaker.record_failure()
+        assert breaker.state == ZBREAKER_OPEN
+
+    breaker.now += 12
+    assert breaker.probe_due()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.now += 5
+    assert breaker.probe_due()
+
+
+def test_breaker_reset() -> None:
+    """Test a reset allows a probe on the next call."""
+    breaker = ManualBreaker(threshold=1, cooldown=5)
+    breaker.reset()
+    assert breaker.state == ZBREAKER_CLOSED
+    breaker.record_failure()
+    breaker.reset()
+    assert breaker.probe_due()
+
+
+async def test_scheduler_keeps_interactive_slot() -> None:
+    """Test background requests leave one slot for interactive requests."""
+    scheduler = ZidooRequestScheduler(limit=3)
+    await scheduler.acquire(ZPRIORITY_BACKGROUND)
+    await scheduler.acquire(ZPRIORITY_BACKGROUND)
+    background = asyncio.ensure_future(scheduler.acquire(ZPRIORITY_BACKGROUND))
+    await asyncio.sleep(0)
+    assert not background.done()
+    assert scheduler.queued == 1
+
+    await asyncio.wait_for(scheduler.acquire(ZPRIORITY_INTERACTIVE), 1)
+    scheduler.release()
+    await asyncio.sleep(0)
+    assert not background.done()
+
+    scheduler.release()
+    await asyncio.wait_for(background, 1)
+    assert scheduler.queued == 0
+
+
+async def test_scheduler_priority_order() -> None:
+    """Test queued requests run by priority, then in order."""
+    scheduler = ZidooRequestScheduler(limit=1)
+    started = []
+
+    async def request(name: str, priority: int) -> None:
+        async with scheduler.slot(priority):
+            started.append(name)
+            await asyncio.sleep(0)
+
+    await scheduler.acquire()
+    tasks = [
+        asyncio.ensure_future(request(name, priority))
+        for name, priority in (
+            ("library", ZPRIORITY_BACKGROUND),
+            ("poll", ZPRIORITY_STATUS),
+            ("play", ZPRIORITY_INTERACTIVE),
+            ("pause", ZPRIORITY_INTERACTIVE),
+        )
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.queued == 4
+
+    scheduler.release()
+    await asyncio.wait_for(asyncio.gather(*tasks), 1)
+    assert started == ["play", "pause", "poll", "library"]
+
+
+async def test_scheduler_cancelled_waiter() -> None:
+    """Test a cancelled waiter does not keep a slot."""
+    scheduler = ZidooRequestScheduler(limit=1)
+    await scheduler.acquire()
+    waiter = asyncio.ensure_future(scheduler.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    scheduler.release()
+    assert scheduler.queued == 0
+    await asyncio.wait_for(scheduler.acquire(), 1)
+
+    # cancelled after being handed the slot
+    waiter = asyncio.ensure_future(scheduler.acquire())
+    await asyncio.sleep(0)
+    scheduler.release()
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    await asyncio.wait_for(scheduler.acquire(), 1)